@@ -0,0 +1,37 @@
+import argparse
+import sys
+from time import perf_counter
+
+from advent.runner import format_time, load_solver
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve one day over many inputs.")
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", type=int, choices=[1, 2])
+    parser.add_argument("paths", nargs="+", help="input files to solve")
+    parser.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    solver = load_solver(args.day)
+
+    start = perf_counter()
+    failed = 0
+    for result in solver.solve_many(args.paths, args.part, args.workers):
+        if result.error:
+            failed += 1
+            print(f"{result.path}: ERROR\n{result.error}")
+        else:
+            print(f"{result.path}: {result.answer} ({format_time(result.elapsed)} ms)")
+
+    elapsed = perf_counter() - start
+    print(f"\nSolved {len(args.paths) - failed}/{len(args.paths)} inputs", end="")
+    print(f" in {format_time(elapsed)} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
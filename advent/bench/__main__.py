@@ -0,0 +1,95 @@
+import argparse
+import sys
+
+from advent.bench.suite import (
+    PHASES,
+    bench_day,
+    compare,
+    format_results,
+    load_baseline,
+    regressions,
+    save_results,
+)
+from advent.generators import write_input
+from advent.runner import discover_days
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the solvers.")
+    parser.add_argument(
+        "-d", "--day", type=int, nargs="+", help="days to benchmark (default: all)"
+    )
+    parser.add_argument(
+        "--phase",
+        nargs="+",
+        choices=PHASES,
+        default=list(PHASES),
+        help="phases to time (default: all)",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="+",
+        default=["data.txt"],
+        help="input files, either a path or a file name in each day folder",
+    )
+    parser.add_argument(
+        "-s",
+        "--scale",
+        type=float,
+        nargs="+",
+        default=[],
+        help="also benchmark generated inputs at these size multipliers",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs")
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure the peak traced memory of each phase in one extra run",
+    )
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown of the median that counts as a regression",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    days = args.day or discover_days()
+    phases = tuple(phase for phase in PHASES if phase in args.phase)
+
+    results = []
+    for day in days:
+        generated = [write_input(day, scale, args.seed) for scale in args.scale]
+        for input_file in args.input + generated:
+            results.extend(
+                bench_day(
+                    day, input_file, phases, args.warmup, args.repeat, args.memory
+                )
+            )
+
+    comparisons = (
+        compare(results, load_baseline(args.baseline)) if args.baseline else []
+    )
+    print(format_results(results, comparisons, args.threshold))
+
+    if args.json:
+        save_results(results, args.json)
+
+    slower = regressions(comparisons, args.threshold)
+    for comparison in slower:
+        print(
+            f"Regression in {comparison.key}: {comparison.ratio:.2f}x slower than baseline"
+        )
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from statistics import median
+
+from advent.bench.suite import Comparison, format_ms, load_baseline, regressions
+from advent.runner import discover_days, format_columns
+
+HEAVY_MODULES = ("requests", "selectolax", "dotenv", "numpy", "scipy", "shapely")
+
+
+@dataclass
+class ImportResult:
+    module: str
+    samples: list[float]
+    heavy: list[str]
+
+    @property
+    def median(self) -> float:
+        return median(self.samples)
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "median": self.median}
+
+
+def parse_importtime(stderr: str, module: str) -> float:
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+    raise ValueError(f"No import time reported for {module}")
+
+
+def measure_import(module: str, repeat: int = 5) -> ImportResult:
+    script = (
+        f"import sys, {module}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    samples: list[float] = []
+    heavy: list[str] = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(parse_importtime(process.stderr, module))
+        heavy = [name for name in process.stdout.strip().split(",") if name]
+    return ImportResult(module=module, samples=samples, heavy=heavy)
+
+
+def default_modules() -> list[str]:
+    days = [f"advent.day{day}.solver" for day in discover_days()]
+    return days + ["advent.cli", "advent.main"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark module import times.")
+    parser.add_argument("modules", nargs="*", help="modules to import (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="imports per module")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative slowdown of the median that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = [
+        measure_import(module, args.repeat)
+        for module in args.modules or default_modules()
+    ]
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    comparisons = [
+        Comparison(result.module, baseline[result.module], result.median)
+        for result in results
+        if result.module in baseline
+    ]
+    by_module = {comparison.key: comparison for comparison in comparisons}
+
+    header = ("Module", "Median ms", "Min ms", "Baseline", "Heavy imports")
+    rows = []
+    for result in results:
+        comparison = by_module.get(result.module)
+        status = f"{comparison.ratio:.2f}x" if comparison else ""
+        if comparison and comparison.is_regression(args.threshold):
+            status += " REGRESSION"
+        rows.append(
+            (
+                result.module,
+                format_ms(result.median),
+                format_ms(min(result.samples)),
+                status,
+                ", ".join(result.heavy),
+            )
+        )
+    print(format_columns(header, rows))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({result.module: result.to_dict() for result in results}, f)
+
+    slower = regressions(comparisons, args.threshold)
+    heavy = [result for result in results if result.heavy]
+    for result in heavy:
+        print(f"{result.module} eagerly imports {', '.join(result.heavy)}")
+    return 1 if slower or heavy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import json
+from dataclasses import asdict, dataclass
+from os.path import basename, exists
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+from advent.cache import ParsedInputCache
+from advent.memory import format_mib, measure_memory
+from advent.runner import format_columns, input_path, load_solver, warm_imports
+
+PHASES = ("parse", "part1", "part2")
+
+
+@dataclass
+class BenchResult:
+    day: int
+    input: str
+    phase: str
+    samples: list[float]
+    peak_memory: int | None = None
+
+    @property
+    def key(self) -> str:
+        return f"day{self.day}/{self.input}/{self.phase}"
+
+    @property
+    def median(self) -> float:
+        return median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "median": self.median, "p95": self.p95}
+
+
+@dataclass
+class Comparison:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    rank = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(rank)]
+
+
+def resolve_input(day: int, name: str) -> str:
+    return name if exists(name) else input_path(day, name)
+
+
+def measure(
+    prepare: Callable[[], object],
+    action: Callable[[object], object],
+    warmup: int,
+    repeat: int,
+) -> list[float]:
+    samples: list[float] = []
+    for iteration in range(warmup + repeat):
+        argument = prepare()
+        start = perf_counter()
+        action(argument)
+        elapsed = perf_counter() - start
+        if iteration >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def measure_peak(
+    prepare: Callable[[], object], action: Callable[[object], object]
+) -> int:
+    warm_imports()
+    argument = prepare()
+    with measure_memory() as usage:
+        action(argument)
+    return usage.traced_peak
+
+
+def bench_day(
+    day: int,
+    input_file: str,
+    phases: tuple[str, ...] = PHASES,
+    warmup: int = 1,
+    repeat: int = 5,
+    memory: bool = False,
+) -> list[BenchResult]:
+    solver = load_solver(day)
+    with open(resolve_input(day, input_file), "r") as f:
+        text = f.read()
+
+    cache = ParsedInputCache()
+    actions: dict[str, tuple[Callable[[], object], Callable[[object], object]]] = {
+        "parse": (lambda: text, solver.parse_input),
+        "part1": (lambda: cache.parse(solver, text), solver.solve_part1),
+        "part2": (lambda: cache.parse(solver, text), solver.solve_part2),
+    }
+
+    results: list[BenchResult] = []
+    for phase in phases:
+        prepare, action = actions[phase]
+        samples = measure(prepare, action, warmup, repeat)
+        peak_memory = measure_peak(prepare, action) if memory else None
+        results.append(
+            BenchResult(
+                day=day,
+                input=basename(input_file),
+                phase=phase,
+                samples=samples,
+                peak_memory=peak_memory,
+            )
+        )
+    return results
+
+
+def save_results(results: list[BenchResult], path: str):
+    with open(path, "w") as f:
+        json.dump({result.key: result.to_dict() for result in results}, f, indent=2)
+
+
+def load_baseline(path: str) -> dict[str, float]:
+    with open(path, "r") as f:
+        data = json.load(f)
+    return {key: entry["median"] for key, entry in data.items()}
+
+
+def compare(results: list[BenchResult], baseline: dict[str, float]) -> list[Comparison]:
+    return [
+        Comparison(key=result.key, baseline=baseline[result.key], current=result.median)
+        for result in results
+        if result.key in baseline
+    ]
+
+
+def regressions(comparisons: list[Comparison], threshold: float) -> list[Comparison]:
+    return [
+        comparison for comparison in comparisons if comparison.is_regression(threshold)
+    ]
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.3f}"
+
+
+def format_results(
+    results: list[BenchResult],
+    comparisons: list[Comparison] | None = None,
+    threshold: float = 0.1,
+) -> str:
+    by_key = {comparison.key: comparison for comparison in comparisons or []}
+    header = (
+        "Day",
+        "Input",
+        "Phase",
+        "Median ms",
+        "P95 ms",
+        "Min ms",
+        "Peak MiB",
+        "Baseline",
+    )
+    rows = []
+    for result in results:
+        comparison = by_key.get(result.key)
+        status = ""
+        if comparison:
+            status = f"{comparison.ratio:.2f}x"
+            if comparison.is_regression(threshold):
+                status += " REGRESSION"
+        rows.append(
+            (
+                str(result.day),
+                result.input,
+                result.phase,
+                format_ms(result.median),
+                format_ms(result.p95),
+                format_ms(min(result.samples)),
+                format_mib(result.peak_memory),
+                status,
+            )
+        )
+    return format_columns(header, rows)
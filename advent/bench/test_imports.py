@@ -0,0 +1,19 @@
+from .imports import measure_import, parse_importtime
+
+
+def test_parse_importtime():
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        450 |   advent.cli",
+            "import time:        80 |       1500 | advent.day1.solver",
+        ]
+    )
+    assert parse_importtime(stderr, "advent.day1.solver") == 0.0015
+
+
+def test_solvers_do_not_import_heavy_modules():
+    for day in (1, 8, 9, 10):
+        result = measure_import(f"advent.day{day}.solver", repeat=1)
+        assert result.heavy == []
+        assert result.median > 0
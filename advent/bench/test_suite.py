@@ -0,0 +1,23 @@
+from .suite import BenchResult, bench_day, compare, percentile, regressions
+
+
+def test_percentile():
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 95) == 95.0
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_bench_day():
+    results = bench_day(1, "test.txt", warmup=1, repeat=3)
+    assert [result.phase for result in results] == ["parse", "part1", "part2"]
+    assert all(len(result.samples) == 3 for result in results)
+
+
+def test_compare_flags_regressions():
+    results = [
+        BenchResult(day=1, input="data.txt", phase="parse", samples=[2.0]),
+        BenchResult(day=1, input="data.txt", phase="part1", samples=[1.0]),
+    ]
+    baseline = {"day1/data.txt/parse": 1.0, "day1/data.txt/part1": 1.0}
+    slower = regressions(compare(results, baseline), threshold=0.1)
+    assert [comparison.key for comparison in slower] == ["day1/data.txt/parse"]
@@ -0,0 +1,189 @@
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+from contextlib import suppress
+from os import getenv, listdir, makedirs, remove, replace, stat, utime
+from os.path import dirname, join, relpath
+from tempfile import mkstemp
+from typing import Any, Callable
+
+import advent
+
+PACKAGE_DIR = dirname(advent.__file__)
+DEFAULT_CACHE_DIR = join(dirname(PACKAGE_DIR), ".cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def cache_dir(*parts: str) -> str:
+    return join(getenv("ADVENT_CACHE_DIR", DEFAULT_CACHE_DIR), *parts)
+
+
+def content_hash(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def module_sources(folder: str) -> list[str]:
+    return [
+        join(folder, filename)
+        for filename in sorted(listdir(folder))
+        if filename.endswith(".py")
+        and not filename.startswith("test_")
+        and filename != "conftest.py"
+    ]
+
+
+def solver_sources(solver) -> list[str]:
+    folder = dirname(inspect.getfile(type(solver)))
+    return module_sources(PACKAGE_DIR) + module_sources(folder)
+
+
+def source_hash(solver) -> str:
+    return content_hash(
+        ":".join(
+            f"{relpath(path, PACKAGE_DIR)}={file_hash(path)}"
+            for path in solver_sources(solver)
+        )
+    )
+
+
+def write_atomic(path: str, data: bytes) -> bool:
+    directory = dirname(path)
+    try:
+        makedirs(directory, exist_ok=True)
+        handle, temporary = mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with open(handle, "wb") as f:
+                f.write(data)
+            replace(temporary, path)
+        finally:
+            with suppress(FileNotFoundError):
+                remove(temporary)
+    except OSError as error:
+        logger.warning("Could not write cache entry %s: %s", path, error)
+        return False
+    return True
+
+
+def solver_name(solver) -> str:
+    solver_type = type(solver)
+    return f"{solver_type.__module__}.{solver_type.__name__}".replace(".", "_")
+
+
+class ParsedInputCache:
+    def __init__(
+        self, directory: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.directory = directory or cache_dir("parsed")
+        self.max_bytes = max_bytes
+
+    def key(self, solver, text: str) -> str:
+        digest = content_hash(f"{content_hash(text)}:{source_hash(solver)}")
+        return f"{solver_name(solver)}-{digest}"
+
+    def path(self, key: str) -> str:
+        return join(self.directory, f"{key}.pickle")
+
+    def get(self, key: str) -> Any | None:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            with suppress(FileNotFoundError):
+                remove(path)
+            return None
+
+        with suppress(FileNotFoundError):
+            utime(path)
+        return value
+
+    def put(self, key: str, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if write_atomic(self.path(key), data):
+            self.evict()
+
+    def evict(self):
+        entries = []
+        for filename in listdir(self.directory):
+            if filename.endswith(".pickle"):
+                with suppress(FileNotFoundError):
+                    info = stat(join(self.directory, filename))
+                    entries.append((info.st_mtime, info.st_size, filename))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, filename in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with suppress(FileNotFoundError):
+                remove(join(self.directory, filename))
+            total -= size
+
+    def parse(self, solver, text: str) -> Any:
+        key = self.key(solver, text)
+        data = self.get(key)
+        if data is None:
+            data = solver.parse_input(text)
+            self.put(key, data)
+        return data
+
+
+class AnswerCache:
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or cache_dir("answers")
+
+    def key(self, solver, input_file: str, part: int) -> str:
+        digest = content_hash(f"{file_hash(input_file)}:{source_hash(solver)}")
+        return f"{solver_name(solver)}-part{part}-{digest}"
+
+    def path(self, key: str) -> str:
+        return join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> str | None:
+        try:
+            with open(self.path(key), "r") as f:
+                return json.load(f)["answer"]
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError):
+            with suppress(FileNotFoundError):
+                remove(self.path(key))
+            return None
+
+    def put(self, key: str, answer: str):
+        write_atomic(self.path(key), json.dumps({"answer": answer}).encode())
+
+    def solve(
+        self, solver, input_file: str, part: int, compute: Callable[[], str]
+    ) -> str:
+        return self.solve_parts(solver, input_file, [part], lambda: [compute()])[0]
+
+    def solve_parts(
+        self,
+        solver,
+        input_file: str,
+        parts: list[int],
+        compute: Callable[[], list[str]],
+    ) -> list[str]:
+        keys = [self.key(solver, input_file, part) for part in parts]
+        answers = [self.get(key) for key in keys]
+        if any(answer is None for answer in answers):
+            answers = compute()
+            for key, answer in zip(keys, answers):
+                self.put(key, answer)
+        return answers
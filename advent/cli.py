@@ -0,0 +1,96 @@
+import argparse
+import sys
+from os.path import basename, dirname, join
+
+from advent.cache import AnswerCache, ParsedInputCache
+from advent.profiling import DEFAULT_PROFILE_DIR, Profiler
+from advent.runner import solve_file_parts, stream_file_parts
+from advent.solver import REFERENCE, BaseSolver, create_solver
+from advent.streaming import supports_streaming
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve one or both parts of a day.")
+    parser.add_argument("input", help="input file name in the day folder")
+    parser.add_argument(
+        "part", choices=["1", "2", "both"], help="part to solve, or both from one parse"
+    )
+    parser.add_argument(
+        "submit", nargs="?", help="submit the answer when given (e.g. 'submit')"
+    )
+    parser.add_argument(
+        "--engine", default=REFERENCE, help=f"solver engine (default: {REFERENCE})"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_PROFILE_DIR,
+        metavar="DIR",
+        help=f"profile each phase and write stats to DIR (default: {DEFAULT_PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="functions listed per profiled phase"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse and solve the input from scratch",
+    )
+    parser.add_argument(
+        "--stream", action="store_true", help="stream the input line by line"
+    )
+    parser.add_argument(
+        "--mmap", action="store_true", help="memory-map the input when streaming"
+    )
+    args = parser.parse_args(argv)
+    if args.submit and args.part == "both":
+        parser.error("submit needs a single part")
+    return args
+
+
+def run(solver: BaseSolver, solver_file: str, argv: list[str] | None = None):
+    args = parse_args(argv)
+
+    folder = basename(dirname(solver_file))
+    input_file = join(dirname(solver_file), args.input)
+    parts = [1, 2] if args.part == "both" else [int(args.part)]
+    if args.engine != REFERENCE:
+        solver = create_solver(sys.modules[type(solver).__module__], args.engine)
+
+    profiler = Profiler(args.profile, f"{folder}_part{args.part}", args.top)
+    cache = None if args.no_cache or profiler.enabled else ParsedInputCache()
+    stream = args.stream and supports_streaming(solver)
+
+    def compute() -> list[str]:
+        if stream:
+            with profiler.phase("solve"):
+                return stream_file_parts(solver, input_file, parts, args.mmap)
+        return solve_file_parts(solver, input_file, parts, profiler, cache)
+
+    if args.no_cache or profiler.enabled:
+        solutions = compute()
+    else:
+        solutions = AnswerCache().solve_parts(solver, input_file, parts, compute)
+    if profiler.enabled:
+        print(profiler.report())
+    if len(parts) == 1:
+        print("Solution:", solutions[0])
+    else:
+        for part, solution in zip(parts, solutions):
+            print(f"Part {part} solution:", solution)
+
+    if args.submit:
+        from dotenv import load_dotenv
+
+        from advent.submission import QueuedSubmitter
+
+        load_dotenv()
+        submitter = QueuedSubmitter()
+        day = int(folder.replace("day", ""))
+
+        submission = submitter.submit(day=day, level=parts[0], answer=solutions[0])
+        if submission.from_ledger:
+            hint = f" ({submission.hint})" if submission.hint else ""
+            print(f"Not submitted: {submission.answer} was {submission.outcome}{hint}")
+        else:
+            print("Submission Response:", submission.message)
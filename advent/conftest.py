@@ -0,0 +1,95 @@
+import re
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Callable
+from urllib.parse import parse_qs
+
+import pytest
+
+DAY_TESTS = re.compile(r"advent\.day\d+\.test_solver$")
+
+
+@dataclass
+class StubRequest:
+    method: str
+    path: str
+    headers: dict[str, str]
+    form: dict[str, str]
+    port: int
+
+
+@dataclass
+class StubReply:
+    status: int
+    body: str = ""
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class StubServer:
+    def __init__(self):
+        self.routes: dict[tuple[str, str], Callable[[StubRequest], StubReply]] = {}
+        self.requests: list[StubRequest] = []
+        self.failures = 0
+        self.url = ""
+
+    def route(self, method: str, path: str, reply: Callable[[StubRequest], StubReply]):
+        self.routes[(method, path)] = reply
+
+    def handle(self, request: StubRequest) -> StubReply:
+        self.requests.append(request)
+        if self.failures:
+            self.failures -= 1
+            return StubReply(503)
+        reply = self.routes.get((request.method, request.path))
+        return reply(request) if reply else StubReply(404)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    stub: StubServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode()
+        form = {key: values[0] for key, values in parse_qs(body).items()}
+        request = StubRequest(
+            method, self.path, dict(self.headers), form, self.client_address[1]
+        )
+        reply = self.stub.handle(request)
+
+        payload = reply.body.encode()
+        self.send_response(reply.status)
+        for name, value in reply.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self.respond("GET")
+
+    def do_POST(self):
+        self.respond("POST")
+
+
+@pytest.fixture
+def stub_server():
+    stub = StubServer()
+    handler = type("Handler", (StubHandler,), {"stub": stub})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    stub.url = f"http://127.0.0.1:{server.server_port}"
+    Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(request, tmp_path_factory, monkeypatch):
+    if DAY_TESTS.match(request.module.__name__):
+        return
+    monkeypatch.setenv("ADVENT_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
@@ -0,0 +1,170 @@
+import argparse
+import importlib
+import sys
+from dataclasses import dataclass
+from math import ceil
+from typing import Callable
+
+from advent.generators import GENERATORS, generate
+from advent.runner import load_solver
+from advent.solver import REFERENCE, BaseSolver, engines
+
+
+@dataclass
+class Mismatch:
+    day: int
+    engine: str
+    part: int
+    seed: int
+    text: str
+    expected: str
+    actual: str
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"day{self.day} engine {self.engine} differs from {REFERENCE} "
+                f"on part {self.part} (seed {self.seed})",
+                f"Expected: {self.expected}",
+                f"Actual:   {self.actual}",
+                "Minimized input:",
+                self.text,
+            ]
+        )
+
+
+def run_solver(solver: BaseSolver, text: str, part: int) -> str:
+    data = solver.parse_input(text)
+    return solver.solve_part1(data) if part == 1 else solver.solve_part2(data)
+
+
+def find_difference(
+    reference: BaseSolver, candidate: BaseSolver, text: str, part: int
+) -> tuple[str, str] | None:
+    try:
+        expected = run_solver(reference, text, part)
+    except Exception:
+        return None
+    try:
+        actual = run_solver(candidate, text, part)
+    except Exception as error:
+        actual = f"{type(error).__name__}: {error}"
+    return None if actual == expected else (expected, actual)
+
+
+def ddmin(items: list[str], failing: Callable[[list[str]], bool]) -> list[str]:
+    granularity = 2
+    while len(items) >= 2:
+        size = ceil(len(items) / granularity)
+        chunks = [items[i : i + size] for i in range(0, len(items), size)]
+        for i, chunk in enumerate(chunks):
+            complement = [
+                item for j in range(len(chunks)) if j != i for item in chunks[j]
+            ]
+            if failing(chunk):
+                items, granularity = chunk, 2
+                break
+            if failing(complement):
+                items, granularity = complement, max(granularity - 1, 2)
+                break
+        else:
+            if granularity >= len(items):
+                break
+            granularity = min(granularity * 2, len(items))
+    return items
+
+
+def minimize(text: str, failing: Callable[[str], bool]) -> str:
+    lines = ddmin(text.splitlines(), lambda lines: failing("\n".join(lines) + "\n"))
+    text = "\n".join(lines) + "\n"
+    if len(lines) == 1 and "," in lines[0]:
+        items = ddmin(
+            lines[0].split(","), lambda items: failing(",".join(items) + "\n")
+        )
+        text = ",".join(items) + "\n"
+    return text
+
+
+def cross_check(
+    day: int,
+    engine: str,
+    parts: list[int] | None = None,
+    trials: int = 20,
+    scale: float = 0.02,
+    seed: int = 0,
+) -> Mismatch | None:
+    reference = load_solver(day)
+    candidate = load_solver(day, engine)
+    for trial_seed in range(seed, seed + trials):
+        text = generate(day, scale, trial_seed)
+        for part in parts or [1, 2]:
+            if find_difference(reference, candidate, text, part) is None:
+                continue
+
+            def failing(candidate_text: str) -> bool:
+                difference = find_difference(reference, candidate, candidate_text, part)
+                return difference is not None
+
+            minimized = minimize(text, failing)
+            difference = find_difference(reference, candidate, minimized, part)
+            assert difference is not None
+            expected, actual = difference
+            return Mismatch(day, engine, part, trial_seed, minimized, expected, actual)
+    return None
+
+
+def day_engines(day: int) -> list[str]:
+    module = importlib.import_module(f"advent.day{day}.solver")
+    return [name for name in engines(module) if name != REFERENCE]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check solver engines against the reference on generated inputs."
+    )
+    parser.add_argument(
+        "-d", "--day", type=int, nargs="+", help="days to check (default: all)"
+    )
+    parser.add_argument(
+        "-e", "--engine", nargs="+", help="engines to check (default: all)"
+    )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        nargs="+",
+        choices=[1, 2],
+        default=[1, 2],
+        help="parts to check (default: both)",
+    )
+    parser.add_argument("-n", "--trials", type=int, default=20, help="inputs per day")
+    parser.add_argument(
+        "-s", "--scale", type=float, default=0.02, help="size of generated inputs"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="first generator seed")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    days = args.day or sorted(GENERATORS)
+    checked = 0
+    for day in days:
+        for engine in args.engine or day_engines(day):
+            mismatch = cross_check(
+                day, engine, args.part, args.trials, args.scale, args.seed
+            )
+            checked += 1
+            if mismatch:
+                print(mismatch)
+                return 1
+            print(f"day{day} engine {engine}: {args.trials} inputs match {REFERENCE}")
+
+    if not checked:
+        print("No engines to check")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+import argparse
+import importlib
+import json
+import socket
+import socketserver
+import sys
+from dataclasses import asdict
+from os import getenv, makedirs, remove
+from os.path import abspath, dirname, exists, getmtime
+from threading import Thread
+from time import perf_counter
+
+from advent.cache import cache_dir
+from advent.runner import (
+    RunOptions,
+    RunResult,
+    discover_days,
+    format_time,
+    input_path,
+    run_part,
+    warm_imports,
+)
+
+SOCKET_PATH = getenv("ADVENT_SOCKET", cache_dir("daemon.sock"))
+
+
+class WarmSolvers:
+    def __init__(self, days: list[int]):
+        self.days = days
+        self.mtimes: dict[str, float] = {}
+
+    def day_modules(self, day: int) -> list[str]:
+        prefix = f"advent.day{day}."
+        names = [name for name in sys.modules if name.startswith(prefix)]
+        solver = f"{prefix}solver"
+        return sorted(names, key=lambda name: name == solver)
+
+    def load(self):
+        warm_imports()
+        for day in self.days:
+            importlib.import_module(f"advent.day{day}.solver")
+        self.refresh()
+
+    def refresh(self, days: list[int] | None = None) -> list[int]:
+        reloaded: list[int] = []
+        for day in self.days if days is None else days:
+            names = self.day_modules(day)
+            mtimes = {name: getmtime(sys.modules[name].__file__) for name in names}
+            changed = any(
+                name in self.mtimes and self.mtimes[name] != mtime
+                for name, mtime in mtimes.items()
+            )
+            if changed:
+                for name in names:
+                    importlib.reload(sys.modules[name])
+                reloaded.append(day)
+            self.mtimes.update(mtimes)
+        return reloaded
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, solvers: WarmSolvers):
+        self.solvers = solvers
+        super().__init__(path, DaemonHandler)
+
+    def handle_request_data(self, request: dict) -> dict:
+        command = request.get("command")
+        if command == "ping":
+            return {"days": self.solvers.days}
+        if command == "stop":
+            Thread(target=self.shutdown).start()
+            return {}
+        if command != "solve":
+            return {"error": f"Unknown command: {command}"}
+
+        self.solvers.refresh()
+        options = RunOptions(
+            filename=request["input"], use_cache=request.get("use_cache", True)
+        )
+        return asdict(run_part(request["day"], request["part"], options))
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.handle_request_data(json.loads(line))
+            except Exception as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def serve(path: str = SOCKET_PATH, days: list[int] | None = None) -> DaemonServer:
+    if exists(path):
+        try:
+            send({"command": "ping"}, path)
+        except OSError:
+            remove(path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+
+    makedirs(dirname(path) or ".", exist_ok=True)
+    solvers = WarmSolvers(days or discover_days())
+    solvers.load()
+    return DaemonServer(path, solvers)
+
+
+def send(request: dict, path: str = SOCKET_PATH) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def solve(
+    day: int,
+    part: int,
+    input_file: str,
+    use_cache: bool = True,
+    path: str = SOCKET_PATH,
+) -> RunResult:
+    request = {
+        "command": "solve",
+        "day": day,
+        "part": part,
+        "input": abspath(input_file),
+        "use_cache": use_cache,
+    }
+    response = send(request, path)
+    if "day" not in response:
+        raise RuntimeError(response.get("error", "Invalid daemon response"))
+    return RunResult(**response)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Keep the solvers warm in a daemon.")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("serve", help="run the daemon in the foreground")
+    commands.add_parser("stop", help="stop a running daemon")
+
+    solve_parser = commands.add_parser("solve", help="solve a part on the daemon")
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("part", type=int, choices=[1, 2])
+    solve_parser.add_argument(
+        "input",
+        nargs="?",
+        default="data.txt",
+        help="input file, or a file name in the day folder (default: data.txt)",
+    )
+    solve_parser.add_argument(
+        "--no-cache", action="store_true", help="always parse and solve from scratch"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "serve":
+        start = perf_counter()
+        with serve(args.socket) as server:
+            print(f"Warmed up in {format_time(perf_counter() - start)} ms")
+            print(f"Listening on {args.socket}")
+            try:
+                server.serve_forever()
+            finally:
+                remove(args.socket)
+        return 0
+
+    if args.command == "stop":
+        send({"command": "stop"}, args.socket)
+        return 0
+
+    input_file = args.input if exists(args.input) else input_path(args.day, args.input)
+    start = perf_counter()
+    result = solve(args.day, args.part, input_file, not args.no_cache, args.socket)
+    if result.error:
+        print(result.error)
+        return 1
+    print("Solution:", result.answer)
+    print(f"Solved in {format_time(perf_counter() - start)} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
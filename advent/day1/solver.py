@@ -1,49 +1,58 @@
-import sys
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from dotenv import load_dotenv
-
-from advent.initializer import AdventClient
+from advent import cli
+from advent.memory import MIB, InputSize
+from advent.solver import REFERENCE, BaseSolver
 from math import copysign
 
+START = 50
+DIAL_SIZE = 100
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class Input:
-    rotations: list[int]
+    rotations: "np.ndarray"
 
 
-class Solver:
+class Solver(BaseSolver):
+    def memory_budget(self, size: InputSize) -> int:
+        return 64 * size.lines + MIB
+
     def parse_rotation(self, line: str) -> int:
         direction = line[0]
         value = int(line[1:])
         return value if direction == "R" else -value
 
+    def parse_rotations(self, lines: Iterable[str]) -> Iterator[int]:
+        return (self.parse_rotation(line) for line in lines if line.strip())
+
     def parse_input(self, input: str) -> Input:
-        rotations = [self.parse_rotation(line) for line in input.strip().splitlines()]
-        return Input(rotations=rotations)
+        from advent.parsing import directed_ints
 
-    def solve_part1(self, data: Input) -> str:
+        return Input(rotations=directed_ints(input))
+
+    def count_zero_stops(self, rotations: Iterable[int]) -> int:
         counter = 0
 
-        start = 50
-        position = start
+        position = START
 
-        for rotation in data.rotations:
+        for rotation in rotations:
             position = (position + rotation) % 100
             if position == 0:
                 counter += 1
 
-        return str(counter)
+        return counter
 
-    def solve_part2(self, data: Input) -> str:
+    def count_zero_passes(self, rotations: Iterable[int]) -> int:
         counter = 0
 
-        start = 50
-        position = start
-
-        for rotation in data.rotations:
-            prev_position = position
+        position = START
 
+        for rotation in rotations:
             full_rotations = abs(rotation) // 100
             counter += full_rotations
 
@@ -61,37 +70,86 @@ class Solver:
 
             position = new_position % 100
 
-            print(
-                f"From {prev_position} to {position} with rotation {rotation}, total {counter}"
-            )
+        return counter
 
-        return str(counter)
+    def solve_part1(self, data: Input) -> str:
+        return str(self.count_zero_stops(data.rotations.tolist()))
+
+    def solve_part2(self, data: Input) -> str:
+        return str(self.count_zero_passes(data.rotations.tolist()))
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
+    def solve_stream(self, lines: Iterable[str], first_part: bool) -> str:
+        rotations = self.parse_rotations(lines)
+        if first_part:
+            return str(self.count_zero_stops(rotations))
+        return str(self.count_zero_passes(rotations))
 
 
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
+def dial_positions(rotations: "np.ndarray") -> "np.ndarray":
+    import numpy as np
 
-    folder = __file__.split("/")[-2]
+    return np.cumsum(np.concatenate(([START], rotations)))
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
+def pass_counts(positions: "np.ndarray", rotations: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    left = rotations < 0
+    start = (positions[:-1] - left) // DIAL_SIZE
+    end = (positions[1:] - left) // DIAL_SIZE
+    return np.abs(end - start)
+
+
+@dataclass
+class RotationIndex:
+    positions: "np.ndarray"
+    stops: "np.ndarray"
+    passes: "np.ndarray"
 
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
+    @classmethod
+    def build(cls, rotations: "np.ndarray") -> "RotationIndex":
+        import numpy as np
 
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+        positions = dial_positions(rotations)
+        stops = np.zeros(len(positions), dtype=np.int64)
+        passes = np.zeros(len(positions), dtype=np.int64)
+        np.cumsum(positions[1:] % DIAL_SIZE == 0, out=stops[1:])
+        np.cumsum(pass_counts(positions, rotations), out=passes[1:])
+        return cls(positions % DIAL_SIZE, stops, passes)
+
+    def __len__(self) -> int:
+        return len(self.positions) - 1
+
+    def position(self, step: int) -> int:
+        return int(self.positions[step])
+
+    def zero_stops(self, start: int, end: int) -> int:
+        return int(self.stops[end] - self.stops[start])
+
+    def zero_passes(self, start: int, end: int) -> int:
+        return int(self.passes[end] - self.passes[start])
+
+    def zero_stops_many(self, starts: "np.ndarray", ends: "np.ndarray") -> "np.ndarray":
+        return self.stops[ends] - self.stops[starts]
+
+    def zero_passes_many(
+        self, starts: "np.ndarray", ends: "np.ndarray"
+    ) -> "np.ndarray":
+        return self.passes[ends] - self.passes[starts]
+
+
+class NumpySolver(Solver):
+    def solve_part1(self, data: Input) -> str:
+        positions = dial_positions(data.rotations)[1:]
+        return str(int((positions % DIAL_SIZE == 0).sum()))
+
+    def solve_part2(self, data: Input) -> str:
+        positions = dial_positions(data.rotations)
+        return str(int(pass_counts(positions, data.rotations).sum()))
+
+
+ENGINES = {REFERENCE: Solver, "numpy": NumpySolver}
+
+
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
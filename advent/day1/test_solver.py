@@ -1,10 +1,14 @@
-from .solver import Solver
+import pytest
 
+from advent.testing import solve_cached
 
-def run(first_part: bool, expected: str):
-    solver = Solver()
+from .solver import NumpySolver, RotationIndex, Solver
+
+
+def run(first_part: bool, expected: str, solver_type: type = Solver):
+    solver = solver_type()
     test_path = __file__.replace("test_solver.py", "test.txt")
-    result = solver.solve(test_path, first_part=first_part)
+    result = solve_cached(solver, test_path, first_part)
     assert result == expected
 
 
@@ -14,3 +18,58 @@ def test_part1():
 
 def test_part2():
     run(False, "6")
+
+
+def test_numpy_engine_on_example():
+    run(True, "3", NumpySolver)
+    run(False, "6", NumpySolver)
+
+
+@pytest.mark.parametrize(
+    "text, stops, passes",
+    [
+        ("L0\nR0\n", "0", "0"),
+        ("R100\nL300\n", "0", "4"),
+        ("R50\nL200\n", "2", "3"),
+        ("L50\nL1\n", "1", "1"),
+        ("L50\nR1\n", "1", "1"),
+        ("L50\nL100\n", "2", "2"),
+        ("L150\n", "1", "2"),
+        ("L49\nL1\n", "1", "1"),
+    ],
+)
+def test_numpy_engine_edge_cases(text, stops, passes):
+    solver = NumpySolver()
+    data = solver.parse_input(text)
+    assert (solver.solve_part1(data), solver.solve_part2(data)) == (stops, passes)
+
+
+def replay(rotations: list[int], start: int, end: int) -> tuple[int, int]:
+    position, stops, passes = 50, 0, 0
+    for step, rotation in enumerate(rotations[:end]):
+        for _ in range(abs(rotation)):
+            position = (position + (1 if rotation > 0 else -1)) % 100
+            passes += step >= start and position == 0
+        stops += step >= start and position == 0
+    return stops, passes
+
+
+def test_rotation_index():
+    import numpy as np
+
+    rotations = np.array([-68, -30, 48, -5, 60, -55, -1, -99, 14, -82, 250, -300, 0])
+    index = RotationIndex.build(rotations)
+    queries = [(start, end) for start in range(14) for end in range(start, 14)]
+
+    for start, end in queries:
+        expected = replay(rotations.tolist(), start, end)
+        assert (index.zero_stops(start, end), index.zero_passes(start, end)) == expected
+    assert index.position(3) == 0 and len(index) == 13
+
+    starts, ends = np.array(queries).T
+    assert index.zero_stops_many(starts, ends).tolist() == [
+        index.zero_stops(start, end) for start, end in queries
+    ]
+    assert index.zero_passes_many(starts, ends).tolist() == [
+        index.zero_passes(start, end) for start, end in queries
+    ]
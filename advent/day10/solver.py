@@ -1,12 +1,8 @@
-import sys
 from dataclasses import dataclass
 
-from dotenv import load_dotenv
-
-from advent.initializer import AdventClient
+from advent import cli
+from advent.solver import REFERENCE, BaseSolver
 import re
-from scipy.optimize import LinearConstraint, Bounds, milp
-import numpy as np
 
 lights_pattern = re.compile(r"\[([.#]+)\]")
 buttons_pattern = re.compile(r"\(([\d,]+)\)")
@@ -25,7 +21,7 @@ class Input:
     machines: list[Machine]
 
 
-class Solver:
+class Solver(BaseSolver):
     def parse_machine(self, line: str) -> Machine:
         lights_match = lights_pattern.search(line)
         buttons_matches = buttons_pattern.findall(line)
@@ -81,6 +77,9 @@ class Solver:
             dp = new_dp
 
     def get_min_presses_for_joltage(self, machine: Machine) -> int:
+        from scipy.optimize import LinearConstraint, Bounds, milp
+        import numpy as np
+
         n_buttons = len(machine.buttons)
         n_lights = len(machine.joltage)
 
@@ -121,31 +120,9 @@ class Solver:
             total += presses
         return str(total)
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
-
-
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
 
-    folder = __file__.split("/")[-2]
+ENGINES = {REFERENCE: Solver}
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
-
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
-
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
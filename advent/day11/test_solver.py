@@ -1,3 +1,5 @@
+from advent.testing import solve_cached
+
 from .solver import Solver
 
 
@@ -6,7 +8,7 @@ def run(first_part: bool, expected: str):
     test_path = __file__.replace(
         "test_solver.py", "test.txt" if first_part else "test2.txt"
     )
-    result = solver.solve(test_path, first_part=first_part)
+    result = solve_cached(solver, test_path, first_part)
     assert result == expected
 
 
@@ -1,25 +1,35 @@
-import sys
 from dataclasses import dataclass
+from itertools import combinations
+from math import prod
+from os import makedirs, rename
+from os.path import basename, dirname, exists, join
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
+from advent import cli
+from advent.cache import cache_dir
+from advent.solver import REFERENCE, BaseSolver
 
-from advent.initializer import AdventClient
+if TYPE_CHECKING:
+    import numpy as np
+
+INDEX_DIGITS = 12
+MAX_INDEX_DIGITS = 13
+INDEX_ARRAYS = ("doubled", "doubled_sums", "repeated", "repeated_sums")
+LOAD_ATTEMPTS = 3
 
 
 @dataclass
 class Input:
-    ranges: list[tuple[int, int]]
-
+    ranges: "np.ndarray"
 
-class Solver:
-    def parse_range(self, line: str) -> tuple[int, int]:
-        parts = line.split("-")
-        return int(parts[0]), int(parts[1])
 
+class Solver(BaseSolver):
     def parse_input(self, input: str) -> Input:
-        lines = input.strip().split(",")
-        ranges = [self.parse_range(line) for line in lines]
-        return Input(ranges=ranges)
+        from advent.parsing import int_ranges
+
+        return Input(ranges=int_ranges(input))
 
     def split_into_parts(self, number: int, parts: int) -> list[int]:
         number_str = str(number)
@@ -52,41 +62,212 @@ class Solver:
 
     def solve_part1(self, data: Input) -> str:
         sum = 0
-        for start, end in data.ranges:
+        for start, end in data.ranges.tolist():
             sum += self.count_invalids(start, end, True)
         return str(sum)
 
     def solve_part2(self, data: Input) -> str:
         sum = 0
-        for start, end in data.ranges:
+        for start, end in data.ranges.tolist():
             sum += self.count_invalids(start, end, False)
         return str(sum)
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
 
+def prime_factors(number: int) -> list[int]:
+    factors = []
+    factor = 2
+    while factor * factor <= number:
+        if number % factor == 0:
+            factors.append(factor)
+            while number % factor == 0:
+                number //= factor
+        factor += 1
+    if number > 1:
+        factors.append(number)
+    return factors
 
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
 
-    folder = __file__.split("/")[-2]
+class ArithmeticSolver(Solver):
+    def repeated_sum(self, start: int, end: int, digits: int, block: int) -> int:
+        repeat = (10**digits - 1) // (10**block - 1)
+        low = max(10 ** (block - 1), -(-start // repeat))
+        high = min(10**block - 1, end // repeat)
+        if low > high:
+            return 0
+        return repeat * (low + high) * (high - low + 1) // 2
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
+    def count_invalids(self, start: int, end: int, only_two: bool) -> int:
+        count = 0
+        for digits in range(len(str(start)), len(str(end)) + 1):
+            if only_two:
+                if digits % 2 == 0:
+                    count += self.repeated_sum(start, end, digits, digits // 2)
+                continue
+            factors = prime_factors(digits)
+            for size in range(1, len(factors) + 1):
+                sign = 1 if size % 2 else -1
+                for subset in combinations(factors, size):
+                    block = digits // prod(subset)
+                    count += sign * self.repeated_sum(start, end, digits, block)
+        return count
+
+
+@dataclass
+class InvalidIdIndex:
+    digits: int
+    doubled: "np.ndarray"
+    doubled_sums: "np.ndarray"
+    repeated: "np.ndarray"
+    repeated_sums: "np.ndarray"
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
+    @classmethod
+    def build(cls, digits: int) -> "InvalidIdIndex":
+        import numpy as np
 
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
+        from advent.parsing import INT64
 
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
+        if ArithmeticSolver().count_invalids(1, 10**digits - 1, False) > INT64.max:
+            raise ValueError(f"Invalid IDs below 10^{digits} overflow the prefix sums")
+
+        doubled: list[np.ndarray] = []
+        repeated: list[np.ndarray] = []
+        for length in range(2, digits + 1):
+            groups = []
+            for block in range(1, length):
+                if length % block:
+                    continue
+                repeat = (10**length - 1) // (10**block - 1)
+                blocks = np.arange(10 ** (block - 1), 10**block, dtype=np.int64)
+                groups.append(blocks * repeat)
+                if block * 2 == length:
+                    doubled.append(groups[-1])
+            repeated.append(np.unique(np.concatenate(groups)))
+
+        doubled_ids = np.concatenate(doubled)
+        repeated_ids = np.concatenate(repeated)
+        return cls(
+            digits,
+            doubled_ids,
+            np.concatenate(([0], np.cumsum(doubled_ids))),
+            repeated_ids,
+            np.concatenate(([0], np.cumsum(repeated_ids))),
         )
-        print("Submission Response:", response)
+
+    @classmethod
+    def path(cls, digits: int, directory: str | None = None) -> str:
+        return join(directory or cache_dir("day2"), f"invalid-ids-{digits}")
+
+    @classmethod
+    def read(cls, digits: int, path: str) -> "InvalidIdIndex | None":
+        import numpy as np
+
+        try:
+            arrays = [
+                np.load(join(path, f"{name}.npy"), mmap_mode="r")
+                for name in INDEX_ARRAYS
+            ]
+        except (OSError, ValueError):
+            return None
+        index = cls(digits, *arrays)
+        return index if index.valid() else None
+
+    @classmethod
+    def discard(cls, path: str):
+        parent = dirname(path)
+        makedirs(parent, exist_ok=True)
+        trash = mkdtemp(dir=parent, prefix=f"{basename(path)}.stale.")
+        try:
+            rename(path, join(trash, "index"))
+        except FileNotFoundError:
+            pass
+        finally:
+            rmtree(trash, ignore_errors=True)
+
+    @classmethod
+    def load(cls, digits: int, directory: str | None = None) -> "InvalidIdIndex":
+        path = cls.path(digits, directory)
+        for _ in range(LOAD_ATTEMPTS):
+            index = cls.read(digits, path)
+            if index is not None:
+                return index
+            if exists(path):
+                cls.discard(path)
+            cls.build(digits).save(directory)
+        raise RuntimeError(f"Could not load the invalid ID index from {path}")
+
+    def valid(self) -> bool:
+        import numpy as np
+
+        arrays = [getattr(self, name) for name in INDEX_ARRAYS]
+        if any(array.dtype != np.int64 or array.ndim != 1 for array in arrays):
+            return False
+        if len(self.doubled_sums) != len(self.doubled) + 1:
+            return False
+        if len(self.repeated_sums) != len(self.repeated) + 1:
+            return False
+        arithmetic, largest = ArithmeticSolver(), 10**self.digits - 1
+        totals = [int(self.doubled_sums[-1]), int(self.repeated_sums[-1])]
+        return totals == [
+            arithmetic.count_invalids(1, largest, only_two)
+            for only_two in (True, False)
+        ]
+
+    def save(self, directory: str | None = None):
+        import numpy as np
+
+        path = self.path(self.digits, directory)
+        makedirs(dirname(path), exist_ok=True)
+        temporary = mkdtemp(dir=dirname(path), prefix=f"{basename(path)}.")
+        try:
+            for name in INDEX_ARRAYS:
+                np.save(join(temporary, f"{name}.npy"), getattr(self, name))
+            rename(temporary, path)
+        except OSError:
+            if not exists(path):
+                raise
+        finally:
+            rmtree(temporary, ignore_errors=True)
+
+    def range_sums(self, ranges: "np.ndarray", only_two: bool) -> "np.ndarray":
+        import numpy as np
+
+        if len(ranges) and ranges[:, 1].max() >= 10**self.digits:
+            raise ValueError(f"Ranges must end below 10^{self.digits}")
+        ids = self.doubled if only_two else self.repeated
+        sums = self.doubled_sums if only_two else self.repeated_sums
+        low = np.searchsorted(ids, ranges[:, 0], side="left")
+        high = np.searchsorted(ids, ranges[:, 1], side="right")
+        return sums[high] - sums[low]
+
+
+class IndexedSolver(Solver):
+    def index(self, data: Input) -> InvalidIdIndex:
+        largest = int(data.ranges.max()) if len(data.ranges) else 0
+        digits = min(max(INDEX_DIGITS, len(str(largest))), MAX_INDEX_DIGITS)
+        return InvalidIdIndex.load(digits)
+
+    def total(self, data: Input, only_two: bool) -> int:
+        index = self.index(data)
+        indexed = data.ranges[:, 1] < 10**index.digits
+        total = int(index.range_sums(data.ranges[indexed], only_two).sum())
+        arithmetic = ArithmeticSolver()
+        for start, end in data.ranges[~indexed].tolist():
+            total += arithmetic.count_invalids(start, end, only_two)
+        return total
+
+    def solve_part1(self, data: Input) -> str:
+        return str(self.total(data, True))
+
+    def solve_part2(self, data: Input) -> str:
+        return str(self.total(data, False))
+
+
+ENGINES = {
+    REFERENCE: Solver,
+    "arithmetic": ArithmeticSolver,
+    "indexed": IndexedSolver,
+}
+
+
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
@@ -1,10 +1,14 @@
-from .solver import Solver
+import pytest
+
+from advent.testing import solve_cached
+
+from .solver import ArithmeticSolver, InvalidIdIndex, Solver
 
 
 def run(first_part: bool, expected: str):
     solver = Solver()
     test_path = __file__.replace("test_solver.py", "test.txt")
-    result = solver.solve(test_path, first_part=first_part)
+    result = solve_cached(solver, test_path, first_part)
     assert result == expected
 
 
@@ -14,3 +18,67 @@ def test_part1():
 
 def test_part2():
     run(False, "4174379265")
+
+
+def test_invalid_id_index(tmp_path):
+    import numpy as np
+
+    index = InvalidIdIndex.load(6, str(tmp_path))
+    assert isinstance(index.repeated, np.memmap)
+    assert InvalidIdIndex.load(6, str(tmp_path)).repeated.filename == (
+        index.repeated.filename
+    )
+
+    ranges = np.array([[1, 999_999], [11, 22], [95, 115], [998, 1012], [5, 5]])
+    arithmetic = ArithmeticSolver()
+    for only_two in (True, False):
+        expected = [arithmetic.count_invalids(*pair, only_two) for pair in ranges]
+        assert index.range_sums(ranges, only_two).tolist() == expected
+
+    with pytest.raises(ValueError):
+        index.range_sums(np.array([[1, 10**6]]), True)
+    with pytest.raises(ValueError):
+        InvalidIdIndex.build(19)
+
+
+def test_indexed_falls_back_above_the_index(tmp_path, monkeypatch):
+    from . import solver
+
+    monkeypatch.setenv("ADVENT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(solver, "INDEX_DIGITS", 4)
+    monkeypatch.setattr(solver, "MAX_INDEX_DIGITS", 6)
+    text = "11-22,95-115,998-1012,222220-1188511890,11111111111110-11111111111112\n"
+    indexed, arithmetic = solver.IndexedSolver(), ArithmeticSolver()
+    data = indexed.parse_input(text)
+
+    assert indexed.index(data).digits == 6
+    assert indexed.solve_part1(data) == arithmetic.solve_part1(data)
+    assert indexed.solve_part2(data) == arithmetic.solve_part2(data)
+
+
+def load_total(directory: str) -> int:
+    return int(InvalidIdIndex.load(6, directory).repeated_sums[-1])
+
+
+def test_concurrent_index_builders(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        totals = list(executor.map(load_total, [str(tmp_path)] * 8))
+
+    expected = ArithmeticSolver().count_invalids(1, 10**6 - 1, False)
+    assert totals == [expected] * 8
+    assert [path.name for path in tmp_path.iterdir()] == ["invalid-ids-6"]
+    assert InvalidIdIndex.read(6, str(tmp_path / "invalid-ids-6")) is not None
+
+
+def test_rebuilds_half_written_index(tmp_path):
+    path = InvalidIdIndex.path(6, str(tmp_path))
+    InvalidIdIndex.build(6).save(str(tmp_path))
+    (tmp_path / "invalid-ids-6" / "repeated.npy").unlink()
+    (tmp_path / "invalid-ids-6" / "doubled.npy").write_bytes(b"\x93NUMPY")
+    assert InvalidIdIndex.read(6, path) is None
+
+    index = InvalidIdIndex.load(6, str(tmp_path))
+    assert index.valid()
+    assert InvalidIdIndex.read(6, path) is not None
@@ -1,18 +1,29 @@
-import sys
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from dotenv import load_dotenv
-
-from advent.initializer import AdventClient
+from advent import cli
+from advent.memory import MIB, InputSize
+from advent.solver import REFERENCE, BaseSolver
 from functools import cache
 
+if TYPE_CHECKING:
+    import numpy as np
+
+MAX_INT64_DIGITS = 18
+
 
 @dataclass
 class Input:
     numbers: list[str]
 
 
-class Solver:
+class Solver(BaseSolver):
+    def memory_budget(self, size: InputSize) -> int:
+        return 64 * size.bytes + MIB
+
+    def parse_numbers(self, lines: Iterable[str]) -> Iterator[str]:
+        return (line.strip() for line in lines if line.strip())
+
     def parse_input(self, input: str) -> Input:
         lines = [line.strip() for line in input.strip().splitlines()]
         return Input(numbers=lines)
@@ -56,45 +67,91 @@ class Solver:
             print(number, depth)
             raise
 
-    def solve_part1(self, data: Input) -> str:
+    def total_joltage(self, numbers: Iterable[str], depth: int) -> int:
         total = 0
-        for number in data.numbers:
-            joltage = self.calculate_joltage_recursive(number, 2)
+        for number in numbers:
+            joltage = self.calculate_joltage_recursive(number, depth)
+            self.calculate_joltage_recursive.cache_clear()
             total += joltage
-        return str(total)
+        return total
+
+    def solve_part1(self, data: Input) -> str:
+        return str(self.total_joltage(data.numbers, 2))
 
     def solve_part2(self, data: Input) -> str:
-        total = 0
-        for number in data.numbers:
-            joltage = self.calculate_joltage_recursive(number, 12)
-            total += joltage
-        return str(total)
+        return str(self.total_joltage(data.numbers, 12))
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
+    def solve_stream(self, lines: Iterable[str], first_part: bool) -> str:
+        return str(
+            self.total_joltage(self.parse_numbers(lines), 2 if first_part else 12)
+        )
 
 
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
+class GreedySolver(Solver):
+    def largest_joltage(self, number: str, depth: int) -> int:
+        if depth > len(number):
+            return -1
+        if depth == 0:
+            return 0
 
-    folder = __file__.split("/")[-2]
+        drops = len(number) - depth
+        digits: list[str] = []
+        for digit in number:
+            while drops and digits and digits[-1] < digit:
+                digits.pop()
+                drops -= 1
+            digits.append(digit)
+        return int("".join(digits[:depth]))
+
+    def total_joltage(self, numbers: Iterable[str], depth: int) -> int:
+        return sum(self.largest_joltage(number, depth) for number in numbers)
+
+
+class BatchedSolver(Solver):
+    def largest_digits(self, cells: "np.ndarray", depth: int) -> "np.ndarray":
+        import numpy as np
+
+        lengths = (cells != ord(" ")).sum(axis=1)
+        rows = np.arange(len(cells))
+        columns = np.arange(cells.shape[1])
+        starts = np.zeros(len(cells), dtype=np.int64)
+        digits = np.zeros((len(cells), depth), dtype=np.uint8)
+        for step in range(depth):
+            ends = lengths - depth + step
+            window = (columns >= starts[:, None]) & (columns <= ends[:, None])
+            picks = np.where(window, cells, 0).argmax(axis=1)
+            digits[:, step] = cells[rows, picks] - ord("0")
+            starts = picks + 1
+        return digits
+
+    def joltages(self, cells: "np.ndarray", depth: int) -> list[int]:
+        import numpy as np
+
+        digits = self.largest_digits(cells, depth)
+        if depth <= MAX_INT64_DIGITS:
+            powers = 10 ** np.arange(depth - 1, -1, -1, dtype=np.int64)
+            values = (digits.astype(np.int64) @ powers).tolist()
+        else:
+            values = [int("".join(map(str, row))) for row in digits.tolist()]
+        short = (cells != ord(" ")).sum(axis=1) < depth
+        return [-1 if too_short else value for value, too_short in zip(values, short)]
+
+    def total_joltage(self, numbers: Iterable[str], depth: int) -> int:
+        from advent.grid import Grid
+
+        numbers = list(numbers)
+        banks = [number for number in numbers if number]
+        empty = len(numbers) - len(banks)
+        if depth == 0:
+            return 0
+        if not banks:
+            return -empty
+        cells = Grid.parse("\n".join(banks)).cells
+        return sum(self.joltages(cells, depth)) - empty
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
+ENGINES = {REFERENCE: Solver, "greedy": GreedySolver, "batched": BatchedSolver}
 
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
 
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
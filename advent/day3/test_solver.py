@@ -1,10 +1,12 @@
-from .solver import Solver
+from advent.testing import solve_cached
+
+from .solver import BatchedSolver, GreedySolver, Solver
 
 
 def run(first_part: bool, expected: str):
     solver = Solver()
     test_path = __file__.replace("test_solver.py", "test.txt")
-    result = solver.solve(test_path, first_part=first_part)
+    result = solve_cached(solver, test_path, first_part)
     assert result == expected
 
 
@@ -14,3 +16,25 @@ def test_part1():
 
 def test_part2():
     run(False, "3121910778619")
+
+
+def test_greedy_joltage():
+    greedy = GreedySolver()
+    assert greedy.largest_joltage("12", 3) == -1
+    assert greedy.largest_joltage("987", 0) == 0
+    assert greedy.largest_joltage("5555555", 3) == 555
+    assert greedy.largest_joltage("818181911112111", 12) == 888911112111
+    assert greedy.largest_joltage("234234234234278", 12) == 434234234278
+
+    assert greedy.largest_joltage("1234567890" * 100, 12) == 999999999999
+    assert greedy.largest_joltage("9" * 5 + "1" * 1000 + "8765432", 12) == (
+        999998765432
+    )
+    assert greedy.total_joltage(["987654321111111", "811111111111119"], 2) == 187
+
+
+def test_batched_handles_ragged_banks():
+    banks = ["987654321111111", "81119", "", "234234234234278", "12"]
+    for depth in (0, 2, 3, 12):
+        expected = GreedySolver().total_joltage(banks, depth)
+        assert BatchedSolver().total_joltage(banks, depth) == expected
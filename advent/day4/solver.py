@@ -1,93 +1,55 @@
-import sys
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
+from advent import cli
+from advent.memory import MIB, InputSize
+from advent.solver import REFERENCE, BaseSolver
 
-from advent.initializer import AdventClient
+if TYPE_CHECKING:
+    import numpy as np
+
+    from advent.grid import Grid
+
+ROLL = "@"
 
 
 @dataclass
 class Input:
-    grid: list[list[str]]
+    grid: "Grid"
 
 
-class Solver:
-    def __init__(self):
-        self.directions = []
-        for i in [-1, 0, 1]:
-            for j in [-1, 0, 1]:
-                if i == 0 and j == 0:
-                    continue
-                self.directions.append((i, j))
+class Solver(BaseSolver):
+    def memory_budget(self, size: InputSize) -> int:
+        return 32 * size.bytes + MIB
 
     def parse_input(self, input: str) -> Input:
-        lines = input.strip().splitlines()
-        grid = [list(line.strip()) for line in lines]
+        from advent.grid import Grid
 
-        return Input(grid=grid)
+        return Input(grid=Grid.parse(input))
 
-    def count_around(self, grid: list[list[str]], r: int, c: int) -> int:
-        count = 0
-        for dr, dc in self.directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < len(grid) and 0 <= nc < len(grid[0]):
-                if grid[nr][nc] == "@":
-                    count += 1
-        return count
-
-    def remove_possible(self, data: Input) -> int:
-        count = 0
-        for r, row in enumerate(data.grid):
-            for c, _ in enumerate(row):
-                around = self.count_around(data.grid, r, c)
-                if around < 4 and data.grid[r][c] == "@":
-                    count += 1
-                    data.grid[r][c] = "."
-        return count
+    def removable(self, rolls: "np.ndarray") -> "np.ndarray":
+        from advent.grid import neighbour_counts
+
+        return rolls & (neighbour_counts(rolls) < 4)
 
     def solve_part1(self, data: Input) -> str:
-        count = 0
-        for r, row in enumerate(data.grid):
-            for c, _ in enumerate(row):
-                around = self.count_around(data.grid, r, c)
-                if around < 4 and data.grid[r][c] == "@":
-                    count += 1
-        return str(count)
+        return str(int(self.removable(data.grid.mask(ROLL)).sum()))
 
     def solve_part2(self, data: Input) -> str:
+        rolls = data.grid.mask(ROLL)
         count = 0
         while True:
-            removed = self.remove_possible(data)
-            if removed == 0:
+            removed = self.removable(rolls)
+            removed_count = int(removed.sum())
+            if removed_count == 0:
                 break
-            count += removed
+            count += removed_count
+            rolls &= ~removed
         return str(count)
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
 
+ENGINES = {REFERENCE: Solver}
 
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
-
-    folder = __file__.split("/")[-2]
-
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
-
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
-
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
@@ -1,51 +1,66 @@
-import sys
+import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from dotenv import load_dotenv
+from advent import cli
+from advent.memory import MIB, InputSize
+from advent.solver import REFERENCE, BaseSolver
 
-from advent.initializer import AdventClient
+if TYPE_CHECKING:
+    import numpy as np
+
+blank_line_pattern = re.compile(r"\r?\n\s*\n")
 
 
 @dataclass
 class Input:
-    ranges: list[tuple[int, int]]
-    ids: list[int]
+    ranges: "np.ndarray"
+    ids: "np.ndarray"
 
 
-class Solver:
-    def parse_input(self, input: str) -> Input:
-        ranges: list[tuple[int, int]] = []
-        ids: list[int] = []
+class Solver(BaseSolver):
+    def memory_budget(self, size: InputSize) -> int:
+        return 16 * size.bytes + MIB
 
-        is_ids_line = False
+    def parse_range(self, line: str) -> tuple[int, int]:
+        parts = line.split("-")
+        return int(parts[0]), int(parts[1])
 
-        for line in input.strip().splitlines():
+    def parse_ranges(self, lines: Iterator[str]) -> list[tuple[int, int]]:
+        ranges: list[tuple[int, int]] = []
+        for line in lines:
             data = line.strip()
 
             if data == "":
-                is_ids_line = True
+                if ranges:
+                    break
                 continue
 
-            if is_ids_line:
-                ids.append(int(data))
-            else:
-                parts = data.split("-")
-                ranges.append((int(parts[0]), int(parts[1])))
+            ranges.append(self.parse_range(data))
+        return ranges
 
-        return Input(ranges=ranges, ids=ids)
+    def parse_ids(self, lines: Iterator[str]) -> Iterator[int]:
+        return (int(line) for line in lines if line.strip())
 
-    def solve_part1(self, data: Input) -> str:
+    def parse_input(self, input: str) -> Input:
+        from advent.parsing import extract_ints, int_ranges
+
+        sections = blank_line_pattern.split(input.strip(), maxsplit=1)
+        ids = sections[1] if len(sections) > 1 else ""
+        return Input(ranges=int_ranges(sections[0]), ids=extract_ints(ids))
+
+    def count_fresh(self, ranges: list[tuple[int, int]], ids: Iterable[int]) -> int:
         count = 0
-        for id in data.ids:
-            for start, end in data.ranges:
+        for id in ids:
+            for start, end in ranges:
                 if start <= id <= end:
                     count += 1
                     break
-        return str(count)
+        return count
 
-    def solve_part2(self, data: Input) -> str:
+    def count_all_fresh(self, ranges: list[tuple[int, int]]) -> int:
         merged_ranges: list[tuple[int, int]] = []
-        for start, end in sorted(data.ranges):
+        for start, end in sorted(ranges):
             if not merged_ranges or merged_ranges[-1][1] < start - 1:
                 merged_ranges.append((start, end))
             else:
@@ -53,34 +68,26 @@ class Solver:
                     merged_ranges[-1][0],
                     max(merged_ranges[-1][1], end),
                 )
-        count = sum([end - start + 1 for start, end in merged_ranges])
-        return str(count)
-
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
+        return sum([end - start + 1 for start, end in merged_ranges])
 
+    def solve_part1(self, data: Input) -> str:
+        ranges = [(start, end) for start, end in data.ranges.tolist()]
+        return str(self.count_fresh(ranges, data.ids.tolist()))
 
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
+    def solve_part2(self, data: Input) -> str:
+        ranges = [(start, end) for start, end in data.ranges.tolist()]
+        return str(self.count_all_fresh(ranges))
 
-    folder = __file__.split("/")[-2]
+    def solve_stream(self, lines: Iterable[str], first_part: bool) -> str:
+        lines = iter(lines)
+        ranges = self.parse_ranges(lines)
+        if first_part:
+            return str(self.count_fresh(ranges, self.parse_ids(lines)))
+        return str(self.count_all_fresh(ranges))
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
+ENGINES = {REFERENCE: Solver}
 
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
 
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
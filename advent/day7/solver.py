@@ -1,99 +1,109 @@
-import sys
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
 
-from dotenv import load_dotenv
+from advent import cli
+from advent.memory import MIB, InputSize
+from advent.solver import REFERENCE, BaseSolver
 
-from advent.initializer import AdventClient
-from collections import defaultdict
+if TYPE_CHECKING:
+    import numpy as np
+
+    from advent.grid import Grid
 
 START = "S"
 SPLITTER = "^"
 EMPTY = "."
+MAX_EXACT_PATHS = (2**63 - 1) // 3
 
 
 @dataclass
 class Input:
-    grid: list[list[str]]
+    grid: "Grid"
     start: tuple[int, int]
 
 
 @dataclass
 class StepResult:
-    new_beams: dict[int, int]
+    beams: "np.ndarray"
     count: int
 
+    @property
+    def paths(self) -> int:
+        return int(self.beams.sum())
+
+
+class Solver(BaseSolver):
+    def memory_budget(self, size: InputSize) -> int:
+        return 16 * size.bytes + MIB
 
-class Solver:
     def parse_input(self, input: str) -> Input:
-        grid = [list(line.strip()) for line in input.strip().splitlines()]
-        start: tuple[int, int] | None = None
-        for i in range(len(grid)):
-            for j in range(len(grid[0])):
-                if grid[i][j] == START:
-                    start = (i, j)
+        from advent.grid import Grid
 
+        grid = Grid.parse(input)
+        start = grid.find(START)
         if start is None:
             raise ValueError("Start position not found in the grid")
         return Input(grid=grid, start=start)
 
-    def step(
-        self, grid: list[list[str]], row: int, step_result: StepResult
+    def step(self, splitters: "np.ndarray", step_result: StepResult) -> StepResult:
+        beams = step_result.beams
+        split = beams * splitters
+        new_beams = beams - split
+        new_beams[:-2] += split[1:-1]
+        new_beams[2:] += split[1:-1]
+        count = step_result.count + int((split != 0).sum())
+        return StepResult(beams=new_beams, count=count)
+
+    def simulate(
+        self, rows: Iterable["np.ndarray"], width: int, start_column: int
     ) -> StepResult:
-        new_beams = defaultdict(int)
+        import numpy as np
 
-        count = step_result.count
+        beams = np.zeros(width + 2, dtype=np.int64)
+        beams[start_column + 1] = 1
+        result = StepResult(beams=beams, count=0)
 
-        for beam, paths in step_result.new_beams.items():
-            if grid[row][beam] == SPLITTER:
-                new_beams[beam - 1] += paths
-                new_beams[beam + 1] += paths
-                count += 1
-            else:
-                new_beams[beam] += paths
+        splitters = np.zeros(width + 2, dtype=bool)
+        for row in rows:
+            if result.beams.dtype != object and result.beams.max() > MAX_EXACT_PATHS:
+                result.beams = result.beams.astype(object)
+            splitters[1:-1] = row == ord(SPLITTER)
+            result = self.step(splitters, result)
 
-        return StepResult(new_beams=new_beams, count=count)
+        return result
 
-    def solve_part1(self, data: Input) -> str:
-        current_beams = StepResult(new_beams={data.start[1]: 1}, count=0)
-
-        for r in range(data.start[0] + 1, len(data.grid)):
-            current_beams = self.step(data.grid, r, current_beams)
+    def simulate_grid(self, data: Input) -> StepResult:
+        rows = data.grid.cells[data.start[0] + 1 :]
+        return self.simulate(rows, data.grid.width, data.start[1])
 
-        return str(current_beams.count)
+    def solve_part1(self, data: Input) -> str:
+        return str(self.simulate_grid(data).count)
 
     def solve_part2(self, data: Input) -> str:
-        current_beams = StepResult(new_beams={data.start[1]: 1}, count=0)
+        return str(self.simulate_grid(data).paths)
 
-        for r in range(data.start[0] + 1, len(data.grid)):
-            current_beams = self.step(data.grid, r, current_beams)
+    def solve_both(self, data: Input) -> tuple[str, str]:
+        result = self.simulate_grid(data)
+        return str(result.count), str(result.paths)
 
-        return str(sum([paths for paths in current_beams.new_beams.values()]))
+    def solve_stream(self, lines: Iterable[str], first_part: bool) -> str:
+        from advent.grid import row_array
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
-
-
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
+        lines = iter(lines)
+        for line in lines:
+            if START in line:
+                start_row = line.strip()
+                break
+        else:
+            raise ValueError("Start position not found in the grid")
 
-    folder = __file__.split("/")[-2]
+        rows = (row_array(line.strip()) for line in lines if line.strip())
+        result = self.simulate(rows, len(start_row), start_row.index(START))
+        return str(result.count if first_part else result.paths)
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
+ENGINES = {REFERENCE: Solver}
 
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
 
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
@@ -1,10 +1,12 @@
+from advent.testing import solve_cached
+
 from .solver import Solver
 
 
 def run(first_part: bool, expected: str):
     solver = Solver()
     test_path = __file__.replace("test_solver.py", "test.txt")
-    result = solver.solve(test_path, first_part=first_part)
+    result = solve_cached(solver, test_path, first_part)
     assert result == expected
 
 
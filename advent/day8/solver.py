@@ -1,12 +1,12 @@
-import sys
 from dataclasses import dataclass
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from dotenv import load_dotenv
+from advent import cli
+from advent.memory import MIB, InputSize
+from advent.solver import REFERENCE, BaseSolver
 
-from advent.initializer import AdventClient
-from scipy.spatial.distance import cdist
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 POINT = tuple[int, int, int]
 CIRCUITS = dict[int, set[POINT]]
@@ -14,26 +14,29 @@ CIRCUITS = dict[int, set[POINT]]
 
 @dataclass
 class Input:
-    points: list[POINT]
+    points: "np.ndarray"
 
 
-class Solver:
+class Solver(BaseSolver):
+    def memory_budget(self, size: InputSize) -> int:
+        return 8 * size.lines**2 + MIB
+
     def parse_input(self, input: str) -> Input:
-        lines = input.strip().splitlines()
-        points = []
-        for line in lines:
-            parts = line.strip().split(",")
-            x, y, z = int(parts[0]), int(parts[1]), int(parts[2])
-            points.append((x, y, z))
-        return Input(points=points)
+        from advent.parsing import int_tuples
+
+        return Input(points=int_tuples(input, 3))
 
     def merge_closest(
         self, stop_check: Callable[[int, CIRCUITS], bool], data: Input
     ) -> tuple[CIRCUITS, POINT, POINT]:
+        from scipy.spatial.distance import cdist
+        import numpy as np
+
+        points = [(x, y, z) for x, y, z in data.points.tolist()]
         dists = cdist(data.points, data.points, metric="euclidean")
         circuits: CIRCUITS = {}
         circuit_mapping: dict[POINT, int] = {}
-        for index, point in enumerate(data.points):
+        for index, point in enumerate(points):
             circuit_mapping[point] = index
             circuits[index] = {point}
 
@@ -44,8 +47,8 @@ class Solver:
             dists[a, b] = np.inf
             dists[b, a] = np.inf
 
-            a_island = circuit_mapping.get(data.points[a], -1)
-            b_island = circuit_mapping.get(data.points[b], -1)
+            a_island = circuit_mapping.get(points[a], -1)
+            b_island = circuit_mapping.get(points[b], -1)
 
             if a_island == b_island:
                 pass
@@ -57,22 +60,28 @@ class Solver:
             attempt += 1
             if stop_check(attempt, circuits):
                 break
-        return circuits, data.points[a], data.points[b]
+        return circuits, points[a], points[b]
+
+    def connection_count(self, data: Input) -> int:
+        return 10 if len(data.points) < 1000 else 1000
+
+    def circuit_score(self, circuits: CIRCUITS) -> int:
+        top_circuits = sorted(circuits.values(), key=lambda x: len(x), reverse=True)[:3]
+
+        result = 1
+        for island in top_circuits:
+            result *= len(island)
+        return result
 
     def solve_part1(self, data: Input) -> str:
-        attempts = 10 if len(data.points) < 1000 else 1000
+        attempts = self.connection_count(data)
 
         circuits, _, _ = self.merge_closest(
             stop_check=lambda attempt, _: attempt >= attempts,
             data=data,
         )
 
-        top_circuits = sorted(circuits.values(), key=lambda x: len(x), reverse=True)[:3]
-
-        result = 1
-        for island in top_circuits:
-            result *= len(island)
-        return str(result)
+        return str(self.circuit_score(circuits))
 
     def solve_part2(self, data: Input) -> str:
         _, a, b = self.merge_closest(
@@ -82,31 +91,22 @@ class Solver:
 
         return str(a[0] * b[0])
 
-    def solve(self, input_file: str, first_part: bool) -> str:
-        with open(input_file, "r") as f:
-            input_data = f.read()
-        data = self.parse_input(input_data)
-        return self.solve_part1(data) if first_part else self.solve_part2(data)
+    def solve_both(self, data: Input) -> tuple[str, str]:
+        attempts = self.connection_count(data)
+        scores: list[int] = []
 
+        def stop_check(attempt: int, circuits: CIRCUITS) -> bool:
+            if attempt == attempts:
+                scores.append(self.circuit_score(circuits))
+            return len(circuits) == 1
 
-if __name__ == "__main__":
-    load_dotenv()
-    solver = Solver()
-
-    folder = __file__.split("/")[-2]
+        circuits, a, b = self.merge_closest(stop_check=stop_check, data=data)
+        score = scores[0] if scores else self.circuit_score(circuits)
+        return str(score), str(a[0] * b[0])
 
-    input_file = __file__.replace("solver.py", sys.argv[1])
-    part_one = int(sys.argv[2]) == 1
-    should_submit = len(sys.argv) > 3
 
-    solution = solver.solve(input_file=input_file, first_part=part_one)
-    print("Solution:", solution)
+ENGINES = {REFERENCE: Solver}
 
-    if should_submit:
-        client = AdventClient()
-        day = int(folder.replace("day", ""))
 
-        response = client.submit_response(
-            day=day, level=1 if part_one else 2, answer=solution
-        )
-        print("Submission Response:", response)
+if __name__ == "__main__":
+    cli.run(Solver(), __file__)
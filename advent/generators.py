@@ -0,0 +1,250 @@
+import argparse
+import sys
+from math import isqrt
+from os import makedirs
+from random import Random
+from string import ascii_lowercase
+from typing import Callable
+
+from advent.cache import cache_dir
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def generate_day1(rng: Random, scale: float) -> str:
+    count = scaled(4500, scale)
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(count))
+
+
+def generate_day2(rng: Random, scale: float) -> str:
+    ranges: list[str] = []
+    for _ in range(scaled(36, scale)):
+        digits = rng.randint(2, 10)
+        start = rng.randint(10 ** (digits - 1), 10**digits - 1)
+        end = start + rng.randint(0, min(200_000, 10**digits - start))
+        ranges.append(f"{start}-{end}")
+    return ",".join(ranges)
+
+
+def generate_day3(rng: Random, scale: float) -> str:
+    return "\n".join(
+        "".join(rng.choices("123456789", k=100)) for _ in range(scaled(200, scale))
+    )
+
+
+def generate_day4(rng: Random, scale: float) -> str:
+    side = scaled(136, scale**0.5)
+    return "\n".join(
+        "".join("@" if rng.random() < 0.65 else "." for _ in range(side))
+        for _ in range(side)
+    )
+
+
+def generate_day5(rng: Random, scale: float) -> str:
+    limit = 560_000_000_000_000
+    ranges: list[str] = []
+    for _ in range(scaled(172, scale)):
+        start = rng.randint(1, limit)
+        ranges.append(f"{start}-{start + rng.randint(0, 7_000_000_000_000)}")
+    ids = [str(rng.randint(1, limit)) for _ in range(scaled(1000, scale))]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
+
+
+def generate_day6(rng: Random, scale: float) -> str:
+    rows = ["", "", "", ""]
+    operations = ""
+    for index in range(scaled(1000, scale)):
+        numbers = sorted(
+            (str(rng.randint(1, 9999)) for _ in rows),
+            key=len,
+            reverse=rng.random() < 0.5,
+        )
+        width = max(len(number) for number in numbers)
+        separator = "" if index == 0 else " "
+        left_aligned = rng.random() < 0.5
+        for row_index, number in enumerate(numbers):
+            aligned = number.ljust(width) if left_aligned else number.rjust(width)
+            rows[row_index] += separator + aligned
+        operations += separator + rng.choice("+*").ljust(width)
+    return "\n".join(rows + [operations])
+
+
+def generate_day7(rng: Random, scale: float) -> str:
+    height = scaled(142, scale**0.5)
+    width = scaled(141, scale**0.5) | 1
+    grid: list[str] = []
+    for row in range(height):
+        if row == 0:
+            line = "." * (width // 2) + "S" + "." * (width // 2)
+        elif row % 2 == 1:
+            line = "." * width
+        else:
+            line = "".join(
+                "^" if 0 < column < width - 1 and rng.random() < 0.2 else "."
+                for column in range(width)
+            )
+        grid.append(line)
+    return "\n".join(grid)
+
+
+def generate_day8(rng: Random, scale: float) -> str:
+    return "\n".join(
+        f"{rng.randint(0, 99_999)},{rng.randint(0, 99_999)},{rng.randint(0, 99_999)}"
+        for _ in range(scaled(1000, scale))
+    )
+
+
+def generate_day9(rng: Random, scale: float) -> str:
+    columns = max(2, scaled(496, scale) // 4)
+    xs = sorted(rng.sample(range(1, 100 * columns), columns + 1))
+
+    def levels(low: int, high: int) -> list[int]:
+        values = [rng.randint(low, high)]
+        while len(values) < columns:
+            value = rng.randint(low, high)
+            if value != values[-1]:
+                values.append(value)
+        return values
+
+    tops = levels(50_001, 99_999)
+    bottoms = levels(1, 49_999)
+
+    points = [(xs[0], tops[0])]
+    for index in range(1, columns):
+        points.append((xs[index], tops[index - 1]))
+        points.append((xs[index], tops[index]))
+    points.append((xs[columns], tops[-1]))
+    points.append((xs[columns], bottoms[-1]))
+    for index in range(columns - 1, 0, -1):
+        points.append((xs[index], bottoms[index]))
+        points.append((xs[index], bottoms[index - 1]))
+    points.append((xs[0], bottoms[0]))
+    return "\n".join(f"{x},{y}" for x, y in points)
+
+
+def generate_day10(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for _ in range(scaled(176, scale)):
+        light_count = rng.randint(4, 10)
+        buttons = [
+            sorted(rng.sample(range(light_count), rng.randint(1, light_count - 1)))
+            for _ in range(rng.randint(3, 13))
+        ]
+
+        lights = [False] * light_count
+        for button in rng.sample(buttons, rng.randint(1, min(4, len(buttons)))):
+            for light in button:
+                lights[light] = not lights[light]
+        if not any(lights):
+            for light in buttons[0]:
+                lights[light] = True
+
+        joltage = [0] * light_count
+        for button in buttons:
+            presses = rng.randint(0, 30)
+            for light in button:
+                joltage[light] += presses
+
+        target = "".join("#" if light else "." for light in lights)
+        wiring = " ".join(f"({','.join(map(str, button))})" for button in buttons)
+        lines.append(f"[{target}] {wiring} {{{','.join(map(str, joltage))}}}")
+    return "\n".join(lines)
+
+
+def node_names(count: int) -> list[str]:
+    reserved = {"you", "svr", "dac", "fft", "out"}
+    names: list[str] = []
+    index = 0
+    while len(names) < count:
+        name = ""
+        value = index
+        for _ in range(3):
+            value, letter = divmod(value, 26)
+            name = ascii_lowercase[letter] + name
+        while value:
+            value, letter = divmod(value - 1, 26)
+            name = ascii_lowercase[letter] + name
+        if name not in reserved:
+            names.append(name)
+        index += 1
+    return names
+
+
+def generate_day11(rng: Random, scale: float) -> str:
+    layer_count = max(6, isqrt(scaled(400, scale)))
+    layer_width = max(2, scaled(600, scale) // layer_count)
+    names = iter(node_names(layer_count * layer_width))
+    layers = [[next(names) for _ in range(layer_width)] for _ in range(layer_count)]
+
+    layers[0][0] = "svr"
+    layers[1][0] = "you"
+    layers[layer_count // 3][0] = "fft"
+    layers[2 * layer_count // 3][0] = "dac"
+
+    lines: list[str] = []
+    for index, layer in enumerate(layers):
+        targets = [name for later in layers[index + 1 : index + 3] for name in later]
+        for name in layer:
+            if not targets:
+                outputs = ["out"]
+            else:
+                outputs = rng.sample(targets, min(len(targets), rng.randint(1, 4)))
+                if name == layer[0] and targets[0] not in outputs:
+                    outputs.append(targets[0])
+            lines.append(f"{name}: {' '.join(outputs)}")
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+GENERATORS: dict[int, Callable[[Random, float], str]] = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+}
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for day {day}")
+    return GENERATORS[day](Random(seed), scale) + "\n"
+
+
+def generated_path(day: int, scale: float, seed: int = 0) -> str:
+    return cache_dir("generated", f"day{day}_x{scale:g}_s{seed}.txt")
+
+
+def write_input(day: int, scale: float, seed: int = 0, path: str | None = None) -> str:
+    if path is None:
+        path = generated_path(day, scale, seed)
+        makedirs(cache_dir("generated"), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(generate(day, scale, seed))
+    return path
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Generate scaled puzzle inputs.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("-s", "--scale", type=float, default=1, help="size multiplier")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        write_input(args.day, args.scale, args.seed, args.output)
+    else:
+        sys.stdout.write(generate(args.day, args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
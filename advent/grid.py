@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+NEIGHBOURS_4 = ((-1, 0), (0, -1), (0, 1), (1, 0))
+NEIGHBOURS_8 = tuple(
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+)
+
+
+@dataclass
+class Grid:
+    cells: np.ndarray
+
+    @classmethod
+    def parse(cls, data: str | bytes, fill: str = " ") -> "Grid":
+        if isinstance(data, str):
+            data = data.encode()
+        lines = data.strip(b"\r\n").splitlines()
+        width = max((len(line) for line in lines), default=0)
+        if any(len(line) != width for line in lines):
+            lines = [line.ljust(width, fill.encode()) for line in lines]
+        cells = np.frombuffer(b"".join(lines), dtype=np.uint8)
+        return cls(cells.reshape(len(lines), width).copy())
+
+    @classmethod
+    def read(cls, path: str) -> "Grid":
+        with open(path, "rb") as f:
+            return cls.parse(f.read())
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def mask(self, char: str) -> np.ndarray:
+        return self.cells == ord(char)
+
+    def find(self, char: str) -> tuple[int, int] | None:
+        positions = np.argwhere(self.mask(char))
+        if len(positions) == 0:
+            return None
+        row, column = positions[0]
+        return int(row), int(column)
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+
+def row_array(line: str | bytes) -> np.ndarray:
+    if isinstance(line, str):
+        line = line.encode()
+    return np.frombuffer(line, dtype=np.uint8)
+
+
+def shift(array: np.ndarray, dr: int, dc: int, fill=0) -> np.ndarray:
+    height, width = array.shape
+    target = (
+        slice(max(-dr, 0), height - max(dr, 0)),
+        slice(max(-dc, 0), width - max(dc, 0)),
+    )
+    source = (
+        slice(max(dr, 0), height - max(-dr, 0)),
+        slice(max(dc, 0), width - max(-dc, 0)),
+    )
+    result = np.full_like(array, fill)
+    result[target] = array[source]
+    return result
+
+
+def neighbour_counts(
+    mask: np.ndarray, directions: tuple[tuple[int, int], ...] = NEIGHBOURS_8
+) -> np.ndarray:
+    values = mask.astype(np.uint8)
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for dr, dc in directions:
+        counts += shift(values, dr, dc)
+    return counts
@@ -1,46 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv, listdir, makedirs
-from os.path import exists, join, isfile
-
-from dotenv import load_dotenv
-from requests import Response, get, post
+from os.path import abspath, dirname, exists, getsize, join, isfile
 from shutil import copyfile
-from selectolax.lexbor import LexborHTMLParser
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from advent.session import CachedResponse, CachingSession
 
 
 class AdventClient:
-    def __init__(self):
+    def __init__(
+        self,
+        base_url: str = "https://adventofcode.com/2025",
+        session: "CachingSession | None" = None,
+    ):
         self.cookie = getenv("COOKIE")
-        self.base_url = "https://adventofcode.com/2025"
+        self.base_url = base_url
         self.headers = {"Cookie": f"session={self.cookie}"}
+        self._session = session
 
-    def _get_request(self, day: int, path: str) -> Response:
+    @property
+    def session(self) -> "CachingSession":
+        if self._session is None:
+            from advent.session import CachingSession
+
+            self._session = CachingSession(headers=self.headers)
+        return self._session
+
+    def _get_request(self, day: int, path: str) -> "CachedResponse":
         url = f"{self.base_url}/day/{day}"
         if path:
             url += f"/{path}"
-        response: Response = get(url, headers=self.headers)
-        response.raise_for_status()
-        return response
+        return self.session.get(url)
 
-    def _post_request(self, day: int, path: str, data: dict) -> Response:
+    def _post_request(self, day: int, path: str, data: dict) -> "Response":
         url = f"{self.base_url}/day/{day}/{path}"
-        response: Response = post(url, headers=self.headers, data=data)
-        response.raise_for_status()
-        return response
+        return self.session.post(url, data=data)
 
     def get_input(self, day: int) -> str:
         return self._get_request(day, "input").text
 
     def get_task(self, day: int) -> str:
+        from selectolax.lexbor import LexborHTMLParser
+
         html = self._get_request(day, "").text
         parser = LexborHTMLParser(html)
-        article = parser.css_first("article.day-desc")
-        if article is None or not article.inner_html:
+        articles = [
+            article.inner_html
+            for article in parser.css("article.day-desc")
+            if article.inner_html
+        ]
+        if not articles:
             raise ValueError(f"Could not find task description for day {day}")
 
-        return article.inner_html
+        return "\n".join(articles)
 
     def submit_response(self, day: int, level: int, answer: str) -> str:
+        from selectolax.lexbor import LexborHTMLParser
+
         data = {"level": level, "answer": answer}
         html = self._post_request(day, "answer", data).text
         parser = LexborHTMLParser(html)
@@ -48,48 +70,100 @@ class AdventClient:
         return message.text() if message else "No response message found"
 
 
-class AdventInitializer:
-    def __init__(self):
-        self.client = AdventClient()
+@dataclass
+class DayReport:
+    day: int
+    actions: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: str | None = None
 
-    def initialize_day(self, day: int):
-        day_dir = f"advent/day{day}"
+    def __str__(self) -> str:
+        status = f"failed: {self.error}" if self.error else ", ".join(self.actions)
+        return f"Day {self.day:>2} {self.elapsed:6.2f}s  {status or 'up to date'}"
 
-        if exists(day_dir):
-            return
 
-        makedirs(day_dir, exist_ok=True)
-
-        template_dir = "advent/template"
-        for filename in listdir(template_dir):
+class AdventInitializer:
+    def __init__(
+        self,
+        client: AdventClient | None = None,
+        root: str = dirname(abspath(__file__)),
+        workers: int = 4,
+    ):
+        self.client = client or AdventClient()
+        self.root = root
+        self.workers = workers
+
+    def copy_template(self, day_dir: str, report: DayReport):
+        template_dir = join(self.root, "template")
+        for filename in sorted(listdir(template_dir)):
             src_file = join(template_dir, filename)
+            dest_file = join(day_dir, filename)
 
-            if not isfile(src_file):
+            if not isfile(src_file) or exists(dest_file):
                 continue
-            dest_file = join(day_dir, filename)
             copyfile(src_file, dest_file)
+            report.actions.append(f"copied {filename}")
 
+    def sync_input(self, day: int, day_dir: str, report: DayReport):
         data_file = join(day_dir, "data.txt")
+        if exists(data_file) and getsize(data_file) > 0:
+            return
 
-        if not exists(data_file):
-            input_text = self.client.get_input(day)
-            with open(data_file, "w") as f:
-                f.write(input_text)
+        input_text = self.client.get_input(day)
+        with open(data_file, "w") as f:
+            f.write(input_text)
+        report.actions.append("downloaded data.txt")
 
+    def sync_task(self, day: int, day_dir: str, report: DayReport):
         task_file = join(day_dir, "task.html")
         task_text = self.client.get_task(day)
+
+        if exists(task_file):
+            with open(task_file, "r") as f:
+                if f.read() == task_text:
+                    return
+
         with open(task_file, "w") as f:
             f.write(task_text)
+        report.actions.append("updated task.html")
 
-    def initialize_all_days(self):
+    def initialize_day(self, day: int) -> DayReport:
+        report = DayReport(day=day)
+        start = perf_counter()
+        day_dir = join(self.root, f"day{day}")
+
+        try:
+            makedirs(day_dir, exist_ok=True)
+            self.copy_template(day_dir, report)
+            self.sync_input(day, day_dir, report)
+            self.sync_task(day, day_dir, report)
+        except Exception as e:
+            report.error = str(e)
+
+        report.elapsed = perf_counter() - start
+        return report
+
+    def current_day(self) -> int:
         now = datetime.now()
-        current_day = 12 if now > datetime(now.year, 12, 12) else now.day
+        start = datetime(2025, 12, 1)
+        if now < start:
+            return 0
+        return min(12, (now - start).days + 1)
 
-        for day in range(1, current_day + 1):
-            self.initialize_day(day)
+    def initialize_all_days(self) -> list[DayReport]:
+        days = range(1, self.current_day() + 1)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(self.initialize_day, days))
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
     load_dotenv()
     initializer = AdventInitializer()
-    initializer.initialize_all_days()
+
+    start = perf_counter()
+    reports = initializer.initialize_all_days()
+    for report in reports:
+        print(report)
+    print(f"Initialized {len(reports)} days in {perf_counter() - start:.2f}s")
@@ -1,6 +1,136 @@
-def main():
-    pass
+import argparse
+import sys
+
+from advent.memory import format_mib
+from advent.profiling import DEFAULT_PROFILE_DIR
+from advent.runner import RunOptions, discover_days, format_table, run_all
+from advent.solver import REFERENCE
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the solvers for all days.")
+    parser.add_argument(
+        "-d", "--day", type=int, nargs="+", help="days to run (default: all)"
+    )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        nargs="+",
+        choices=[1, 2],
+        default=[1, 2],
+        help="parts to run (default: both)",
+    )
+    parser.add_argument("-j", "--workers", type=int, help="number of worker processes")
+    parser.add_argument(
+        "-i", "--input", default="data.txt", help="input file name in each day folder"
+    )
+    parser.add_argument(
+        "--engine", default=REFERENCE, help=f"solver engine (default: {REFERENCE})"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_PROFILE_DIR,
+        metavar="DIR",
+        help=f"profile each phase and write stats to DIR (default: {DEFAULT_PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="functions listed per profiled phase"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse and solve the inputs from scratch",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure peak memory and check the memory budgets (slower)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="stream the input line by line for the days that support it",
+    )
+    parser.add_argument(
+        "--mmap", action="store_true", help="memory-map the input when streaming"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="rerun the days whose solver or inputs change until interrupted",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.1,
+        help="seconds between file checks in watch mode",
+    )
+    args = parser.parse_args(argv)
+    if args.profile and args.memory:
+        parser.error("--memory cannot be combined with --profile")
+    return args
+
+
+def watch(
+    days: list[int], parts: list[int], options: RunOptions, interval: float
+) -> int:
+    from advent.watch import Watcher, format_watch
+
+    watcher = Watcher(days, parts, options)
+    watcher.load()
+    print(f"Watching {len(days)} days for changes (Ctrl+C to stop)")
+    try:
+        watcher.watch(lambda results: print(f"\n{format_watch(results)}"), interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    available = discover_days()
+    days = available if args.day is None else sorted(set(args.day))
+    missing = [day for day in days if day not in available]
+    if missing:
+        print(f"Unknown days: {', '.join(str(day) for day in missing)}")
+        return 1
+
+    options = RunOptions(
+        filename=args.input,
+        profile_dir=args.profile,
+        top=args.top,
+        use_cache=not args.no_cache,
+        stream=args.stream,
+        use_mmap=args.mmap,
+        engine=args.engine,
+        measure_memory=args.memory,
+    )
+    if args.watch:
+        return watch(days, sorted(set(args.part)), options, args.interval)
+
+    results = run_all(days, sorted(set(args.part)), options, args.workers)
+    print(format_table(results))
+
+    for result in results:
+        if result.profile:
+            print(f"\n{result.profile}")
+
+    failed = [result for result in results if result.error]
+    for result in failed:
+        print(f"\nDay {result.day} part {result.part} failed:\n{result.error}")
+
+    over_budget = [result for result in results if result.over_budget]
+    for result in over_budget:
+        print(
+            f"\nDay {result.day} part {result.part} used {format_mib(result.memory_peak)}"
+            f" MiB, over its budget of {format_mib(result.memory_budget)} MiB"
+        )
+
+    return 1 if failed or over_budget else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
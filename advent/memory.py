@@ -0,0 +1,73 @@
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+MIB = 1024 * 1024
+
+
+@dataclass
+class InputSize:
+    bytes: int
+    lines: int
+
+
+@dataclass
+class MemoryUsage:
+    traced_peak: int = 0
+    rss_peak: int | None = None
+
+
+def input_size(path: str) -> InputSize:
+    size = InputSize(bytes=0, lines=0)
+    last = b"\n"
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(MIB), b""):
+            size.bytes += len(chunk)
+            size.lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        size.lines += 1
+    return size
+
+
+def reset_peak_rss() -> bool:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss() -> int:
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@contextmanager
+def measure_memory() -> Iterator[MemoryUsage]:
+    import tracemalloc
+
+    usage = MemoryUsage()
+    rss_reset = reset_peak_rss()
+    tracemalloc.start()
+    try:
+        yield usage
+    finally:
+        _, usage.traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        usage.rss_peak = peak_rss() if rss_reset else None
+
+
+def format_mib(size: int | None) -> str:
+    return "" if size is None else f"{size / MIB:.1f}"
@@ -0,0 +1,63 @@
+import re
+
+import numpy as np
+
+DIGITS = b"0123456789"
+INT64 = np.iinfo(np.int64)
+LONE_MINUS = re.compile(rb"-(?![0-9])")
+
+
+def translation(keep: bytes, replace: dict[str, str] | None = None) -> bytes:
+    table = bytearray(b" " * 256)
+    for char in keep:
+        table[char] = char
+    for source, target in (replace or {}).items():
+        table[ord(source)] = ord(target)
+    return bytes(table)
+
+
+UNSIGNED = translation(DIGITS)
+SIGNED = translation(DIGITS + b"-")
+
+
+def as_bytes(data: str | bytes) -> bytes:
+    return data.encode() if isinstance(data, str) else data
+
+
+def parse_ints(data: bytes, table: bytes) -> np.ndarray:
+    values = np.fromstring(data.translate(table), dtype=np.int64, sep=" ")
+    if len(values) and (values.max() == INT64.max or values.min() == INT64.min):
+        raise ValueError("Integers outside the int64 range are not supported")
+    return values
+
+
+def extract_ints(data: str | bytes, signed: bool = False) -> np.ndarray:
+    data = as_bytes(data)
+    if not signed:
+        return parse_ints(data, UNSIGNED)
+    return parse_ints(LONE_MINUS.sub(b" ", data).replace(b"-", b" -"), SIGNED)
+
+
+def directed_ints(
+    data: str | bytes, negative: str = "L", positive: str = "R"
+) -> np.ndarray:
+    data = as_bytes(data)
+    values = parse_ints(data, translation(DIGITS, {negative: "-", positive: " "}))
+    prefixes = data.count(negative.encode()) + data.count(positive.encode())
+    if prefixes != len(values):
+        raise ValueError(f"Every integer needs a {negative} or {positive} prefix")
+    return values
+
+
+def group_ints(values: np.ndarray, width: int) -> np.ndarray:
+    if len(values) % width:
+        raise ValueError(f"Found {len(values)} integers, expected groups of {width}")
+    return values.reshape(-1, width)
+
+
+def int_tuples(data: str | bytes, width: int) -> np.ndarray:
+    return group_ints(extract_ints(data, signed=True), width)
+
+
+def int_ranges(data: str | bytes) -> np.ndarray:
+    return group_ints(extract_ints(data), 2)
@@ -0,0 +1,95 @@
+import io
+from contextlib import contextmanager
+from dataclasses import dataclass
+from os import makedirs
+from os.path import join
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    import cProfile
+
+DEFAULT_PROFILE_DIR = "profiles"
+
+
+@dataclass
+class PhaseProfile:
+    name: str
+    wall_time: float
+    peak_memory: int | None = None
+    stats_file: str | None = None
+    summary: str | None = None
+
+
+class Profiler:
+    def __init__(self, output_dir: str | None = None, prefix: str = "", top: int = 15):
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.top = top
+        self.phases: dict[str, PhaseProfile] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.output_dir is not None
+
+    def wall_time(self, name: str) -> float:
+        return self.phases[name].wall_time if name in self.phases else 0.0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            start = perf_counter()
+            try:
+                yield
+            finally:
+                self.phases[name] = PhaseProfile(name, perf_counter() - start)
+            return
+
+        import cProfile
+        import tracemalloc
+
+        profile = cProfile.Profile()
+        tracemalloc.start()
+        start = perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            wall_time = perf_counter() - start
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.phases[name] = self.save(name, profile, wall_time, peak_memory)
+
+    def save(
+        self, name: str, profile: "cProfile.Profile", wall_time: float, peak_memory: int
+    ) -> PhaseProfile:
+        import pstats
+
+        assert self.output_dir is not None
+        makedirs(self.output_dir, exist_ok=True)
+        base = join(self.output_dir, f"{self.prefix}_{name}" if self.prefix else name)
+
+        stats_file = f"{base}.pstats"
+        profile.dump_stats(stats_file)
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        summary = stream.getvalue().strip()
+        with open(f"{base}.txt", "w") as f:
+            f.write(summary + "\n")
+
+        return PhaseProfile(name, wall_time, peak_memory, stats_file, summary)
+
+    def report(self) -> str:
+        sections = []
+        for phase in self.phases.values():
+            title = f"{self.prefix} {phase.name}".strip()
+            header = f"== {title}: {phase.wall_time * 1000:.1f} ms"
+            if phase.peak_memory is not None:
+                header += f", peak {phase.peak_memory / 1024:.1f} KiB"
+            if phase.stats_file:
+                header += f", stats in {phase.stats_file}"
+            sections.append("\n".join(filter(None, [header, phase.summary])))
+        return "\n\n".join(sections)
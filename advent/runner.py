@@ -0,0 +1,288 @@
+import importlib
+import pkgutil
+import re
+import traceback
+from contextlib import nullcontext
+from dataclasses import dataclass
+from os.path import dirname, join
+
+import advent
+from advent.cache import AnswerCache, ParsedInputCache
+from advent.memory import MemoryUsage, format_mib, input_size, measure_memory
+from advent.profiling import Profiler
+from advent.solver import REFERENCE, BaseSolver, create_solver
+from advent.streaming import stream_file, supports_streaming
+
+DAY_PATTERN = re.compile(r"day(\d+)$")
+WARM_MODULES = (
+    "numpy",
+    "scipy.optimize",
+    "scipy.spatial.distance",
+    "shapely",
+    "advent.grid",
+    "advent.parsing",
+)
+
+
+@dataclass
+class RunOptions:
+    filename: str = "data.txt"
+    profile_dir: str | None = None
+    top: int = 15
+    use_cache: bool = True
+    stream: bool = False
+    use_mmap: bool = False
+    engine: str = REFERENCE
+    measure_memory: bool = False
+
+
+@dataclass
+class RunResult:
+    day: int
+    part: int
+    answer: str
+    read_time: float = 0.0
+    parse_time: float = 0.0
+    solve_time: float = 0.0
+    error: str | None = None
+    profile: str | None = None
+    cached: bool = False
+    shared: bool = False
+    memory_peak: int | None = None
+    rss_peak: int | None = None
+    memory_budget: int | None = None
+
+    @property
+    def total_time(self) -> float:
+        return self.read_time + self.parse_time + self.solve_time
+
+    @property
+    def over_budget(self) -> bool:
+        if self.memory_budget is None or self.memory_peak is None:
+            return False
+        return self.memory_peak > self.memory_budget
+
+
+def discover_days() -> list[int]:
+    days: list[int] = []
+    for module in pkgutil.iter_modules(advent.__path__):
+        match = DAY_PATTERN.match(module.name)
+        if module.ispkg and match:
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def load_solver(day: int, engine: str = REFERENCE) -> BaseSolver:
+    module = importlib.import_module(f"advent.day{day}.solver")
+    return create_solver(module, engine)
+
+
+def warm_imports():
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+
+
+def input_path(day: int, filename: str) -> str:
+    return join(dirname(advent.__file__), f"day{day}", filename)
+
+
+def solve_file_parts(
+    solver: BaseSolver,
+    input_file: str,
+    parts: list[int],
+    profiler: Profiler | None = None,
+    cache: ParsedInputCache | None = None,
+) -> list[str]:
+    profiler = profiler or Profiler()
+
+    with profiler.phase("read"):
+        with open(input_file, "r") as f:
+            input_data = f.read()
+
+    with profiler.phase("parse"):
+        if cache is not None:
+            data = cache.parse(solver, input_data)
+        else:
+            data = solver.parse_input(input_data)
+
+    with profiler.phase("solve"):
+        if parts == [1, 2]:
+            answers = list(solver.solve_both(data))
+        else:
+            answers = [
+                solver.solve_part1(data) if part == 1 else solver.solve_part2(data)
+                for part in parts
+            ]
+
+    return answers
+
+
+def solve_file(
+    solver: BaseSolver,
+    input_file: str,
+    first_part: bool,
+    profiler: Profiler | None = None,
+    cache: ParsedInputCache | None = None,
+) -> str:
+    parts = [1 if first_part else 2]
+    return solve_file_parts(solver, input_file, parts, profiler, cache)[0]
+
+
+def stream_file_parts(
+    solver: BaseSolver, input_file: str, parts: list[int], use_mmap: bool = False
+) -> list[str]:
+    return [stream_file(solver, input_file, part == 1, use_mmap) for part in parts]
+
+
+def run_parts(
+    day: int, parts: list[int], options: RunOptions | None = None
+) -> list[RunResult]:
+    options = options or RunOptions()
+    results = [RunResult(day=day, part=part, answer="") for part in parts]
+    name = f"part{parts[0]}" if len(parts) == 1 else "both"
+    profiler = Profiler(options.profile_dir, f"day{day}_{name}", options.top)
+    use_cache = options.use_cache and not options.measure_memory
+    cache = ParsedInputCache() if use_cache and not profiler.enabled else None
+    answers = AnswerCache() if use_cache and not profiler.enabled else None
+    measure = options.measure_memory and not profiler.enabled
+    usage: MemoryUsage | None = None
+    first = results[0]
+    try:
+        solver = load_solver(day, options.engine)
+        input_file = input_path(day, options.filename)
+        keys = (
+            [answers.key(solver, input_file, part) for part in parts] if answers else []
+        )
+        cached = [answers.get(key) for key in keys] if answers else []
+        if cached and all(answer is not None for answer in cached):
+            solutions = cached
+            for result in results:
+                result.cached = True
+        else:
+            if measure:
+                warm_imports()
+            with measure_memory() if measure else nullcontext() as usage:
+                if options.stream and supports_streaming(solver):
+                    with profiler.phase("solve"):
+                        solutions = stream_file_parts(
+                            solver, input_file, parts, options.use_mmap
+                        )
+                else:
+                    solutions = solve_file_parts(
+                        solver, input_file, parts, profiler, cache
+                    )
+            if measure:
+                first.memory_budget = solver.memory_budget(input_size(input_file))
+        if answers and not results[0].cached:
+            for key, answer in zip(keys, solutions):
+                answers.put(key, answer)
+        for result, answer in zip(results, solutions):
+            result.answer = answer
+    except Exception:
+        for result in results:
+            result.error = traceback.format_exc()
+
+    if usage is not None:
+        first.memory_peak, first.rss_peak = usage.traced_peak, usage.rss_peak
+    first.read_time = profiler.wall_time("read")
+    first.parse_time = profiler.wall_time("parse")
+    first.solve_time = profiler.wall_time("solve")
+    if profiler.enabled:
+        first.profile = profiler.report()
+    for result in results[1:]:
+        result.shared = True
+    return results
+
+
+def run_part(day: int, part: int, options: RunOptions | None = None) -> RunResult:
+    return run_parts(day, [part], options)[0]
+
+
+def run_all(
+    days: list[int],
+    parts: list[int],
+    options: RunOptions | None = None,
+    workers: int | None = None,
+) -> list[RunResult]:
+    if parts == [1, 2] and not (options and options.stream):
+        tasks = [(day, parts) for day in days]
+    else:
+        tasks = [(day, [part]) for day in days for part in parts]
+    results: list[RunResult] = []
+
+    if workers == 1:
+        for day, day_parts in tasks:
+            results.extend(run_parts(day, day_parts, options))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(run_parts, day, day_parts, options)
+                for day, day_parts in tasks
+            ]
+            for future in as_completed(futures):
+                results.extend(future.result())
+
+    return sorted(results, key=lambda result: (result.day, result.part))
+
+
+def format_time(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+def format_columns(header: tuple[str, ...], rows: list[tuple[str, ...]]) -> str:
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    separator = "  ".join("-" * width for width in widths)
+
+    def format_row(row: tuple[str, ...]) -> str:
+        cells = [
+            cell.ljust(width) if i == len(row) - 1 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        return "  ".join(cells).rstrip()
+
+    return "\n".join([format_row(header), separator, *map(format_row, rows)])
+
+
+def format_shared_time(result: RunResult, seconds: float) -> str:
+    return "-" if result.shared else format_time(seconds)
+
+
+def format_answer(result: RunResult) -> str:
+    if result.error:
+        return "ERROR"
+    return f"{result.answer} (cached)" if result.cached else result.answer
+
+
+def format_memory(result: RunResult) -> tuple[str, str, str]:
+    if result.shared:
+        return "-", "-", "-"
+    budget = format_mib(result.memory_budget)
+    if result.over_budget:
+        budget += " OVER"
+    return format_mib(result.memory_peak), format_mib(result.rss_peak), budget
+
+
+def format_table(results: list[RunResult]) -> str:
+    header = ("Day", "Part", "Read ms", "Parse ms", "Solve ms", "Total ms")
+    with_memory = any(result.memory_peak is not None for result in results)
+    if with_memory:
+        header += ("Peak MiB", "RSS MiB", "Budget MiB")
+    rows = []
+    for result in results:
+        row = (
+            str(result.day),
+            str(result.part),
+            format_shared_time(result, result.read_time),
+            format_shared_time(result, result.parse_time),
+            format_shared_time(result, result.solve_time),
+            format_shared_time(result, result.total_time),
+        )
+        if with_memory:
+            row += format_memory(result)
+        rows.append(row + (format_answer(result),))
+
+    total = sum(result.total_time for result in results)
+    table = format_columns(header + ("Answer",), rows)
+    return f"{table}\n\nTotal: {format_time(total)} ms"
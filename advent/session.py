@@ -0,0 +1,118 @@
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass
+from os import makedirs, replace
+from os.path import join
+
+from requests import ConnectionError, Response, Session, Timeout
+from requests.adapters import HTTPAdapter
+
+from advent.cache import cache_dir
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    text: str
+    status_code: int
+    from_cache: bool = False
+
+
+class HttpCache:
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or cache_dir("http")
+
+    def path(self, url: str) -> str:
+        return join(self.directory, f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def load(self, url: str) -> dict | None:
+        try:
+            with open(self.path(url), "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry if entry.get("url") == url else None
+
+    def store(self, url: str, response: Response):
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if not any(validators.values()):
+            return
+
+        makedirs(self.directory, exist_ok=True)
+        path = self.path(url)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump({"url": url, "text": response.text, **validators}, f)
+        replace(f"{path}.tmp", path)
+
+
+class CachingSession:
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        cache: HttpCache | None = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30,
+    ):
+        self.session = Session()
+        self.session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.cache = cache or HttpCache()
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def wait(self, attempt: int):
+        time.sleep(random.uniform(0, self.backoff * 2**attempt))
+
+    def request(self, method: str, url: str, retry: bool = True, **kwargs) -> Response:
+        retries = self.retries if retry else 0
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+            except (ConnectionError, Timeout):
+                if attempt >= retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    return response
+
+            self.wait(attempt)
+            attempt += 1
+
+    def get(self, url: str) -> CachedResponse:
+        entry = self.cache.load(url)
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.request("GET", url, headers=headers)
+        if entry and response.status_code == 304:
+            return CachedResponse(url, entry["text"], 304, from_cache=True)
+
+        response.raise_for_status()
+        self.cache.store(url, response)
+        return CachedResponse(url, response.text, response.status_code)
+
+    def post(self, url: str, data: dict) -> Response:
+        response = self.request("POST", url, retry=False, data=data)
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        self.session.close()
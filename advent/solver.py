@@ -0,0 +1,100 @@
+import traceback
+from dataclasses import dataclass
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Iterable, Iterator
+
+from advent.memory import InputSize
+
+REFERENCE = "reference"
+
+
+@dataclass
+class BatchResult:
+    path: str
+    answer: str | None
+    elapsed: float
+    error: str | None = None
+
+
+worker_solver: "BaseSolver | None" = None
+
+
+def init_worker(solver: "BaseSolver"):
+    global worker_solver
+    worker_solver = solver
+
+
+def solve_in_worker(path: str, first_part: bool) -> BatchResult:
+    assert worker_solver is not None
+    return worker_solver.try_solve(path, first_part)
+
+
+class BaseSolver:
+    def parse_input(self, input: str) -> Any:
+        raise NotImplementedError
+
+    def solve_part1(self, data: Any) -> str:
+        raise NotImplementedError
+
+    def solve_part2(self, data: Any) -> str:
+        raise NotImplementedError
+
+    def memory_budget(self, size: InputSize) -> int | None:
+        return None
+
+    def solve_both(self, data: Any) -> tuple[str, str]:
+        return self.solve_part1(data), self.solve_part2(data)
+
+    def solve(self, input_file: str, first_part: bool) -> str:
+        with open(input_file, "r") as f:
+            input_data = f.read()
+        data = self.parse_input(input_data)
+        return self.solve_part1(data) if first_part else self.solve_part2(data)
+
+    def try_solve(self, input_file: str, first_part: bool) -> BatchResult:
+        start = perf_counter()
+        try:
+            answer = self.solve(input_file, first_part)
+        except Exception:
+            elapsed = perf_counter() - start
+            return BatchResult(input_file, None, elapsed, traceback.format_exc())
+        return BatchResult(input_file, answer, perf_counter() - start)
+
+    def solve_many(
+        self, paths: Iterable[str], part: int, workers: int | None = None
+    ) -> Iterator[BatchResult]:
+        first_part = part == 1
+        if workers == 1:
+            for path in paths:
+                yield self.try_solve(path, first_part)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(self,)
+        ) as executor:
+            futures = {
+                executor.submit(solve_in_worker, path, first_part): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception:
+                    yield BatchResult(
+                        futures[future], None, 0.0, traceback.format_exc()
+                    )
+
+
+def engines(module: ModuleType) -> dict[str, type[BaseSolver]]:
+    return module.ENGINES
+
+
+def create_solver(module: ModuleType, engine: str = REFERENCE) -> BaseSolver:
+    available = engines(module)
+    if engine not in available:
+        names = ", ".join(sorted(available))
+        raise ValueError(f"Unknown engine {engine!r} (available: {names})")
+    return available[engine]()
@@ -0,0 +1,32 @@
+import inspect
+import mmap
+from os.path import basename, dirname, getsize
+from typing import Iterator
+
+BUFFER_SIZE = 1024 * 1024
+
+
+def read_lines(path: str, use_mmap: bool = False) -> Iterator[str]:
+    if use_mmap and getsize(path) > 0:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b""):
+                    yield line.decode().rstrip("\r\n")
+        return
+
+    with open(path, "r", buffering=BUFFER_SIZE) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def supports_streaming(solver) -> bool:
+    return callable(getattr(solver, "solve_stream", None))
+
+
+def stream_file(
+    solver, input_file: str, first_part: bool, use_mmap: bool = False
+) -> str:
+    if not supports_streaming(solver):
+        day = basename(dirname(inspect.getfile(type(solver))))
+        raise ValueError(f"Streaming is not supported for {day}")
+    return solver.solve_stream(read_lines(input_file, use_mmap), first_part)
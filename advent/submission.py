@@ -0,0 +1,200 @@
+import json
+import re
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from os import makedirs, replace
+from os.path import dirname
+from typing import Callable
+
+from advent.cache import cache_dir
+from advent.initializer import AdventClient
+
+CORRECT = "correct"
+INCORRECT = "incorrect"
+TOO_SOON = "too soon"
+WRONG_LEVEL = "wrong level"
+UNKNOWN = "unknown"
+
+WAIT_LEFT_PATTERN = re.compile(r"You have (?:(\d+)m )?(\d+)s left to wait")
+WAIT_MINUTES_PATTERN = re.compile(r"wait (one|\d+) minutes? before trying again")
+
+
+@dataclass
+class Submission:
+    day: int
+    level: int
+    answer: str
+    outcome: str
+    message: str
+    hint: str | None = None
+    wait: float = 0.0
+    submitted_at: float = 0.0
+    from_ledger: bool = False
+
+    @property
+    def accepted(self) -> bool:
+        return self.outcome == CORRECT
+
+
+def parse_wait(message: str) -> float:
+    if match := WAIT_LEFT_PATTERN.search(message):
+        minutes, seconds = match.groups()
+        return int(minutes or 0) * 60 + int(seconds)
+    if match := WAIT_MINUTES_PATTERN.search(message):
+        minutes = match.group(1)
+        return 60 * (1 if minutes == "one" else int(minutes))
+    return 0.0
+
+
+def parse_outcome(message: str) -> tuple[str, str | None]:
+    if "That's the right answer" in message:
+        return CORRECT, None
+    if "That's not the right answer" in message:
+        for hint in ("too high", "too low"):
+            if f"answer is {hint}" in message:
+                return INCORRECT, hint
+        return INCORRECT, None
+    if "You gave an answer too recently" in message:
+        return TOO_SOON, None
+    if "You don't seem to be solving the right level" in message:
+        return WRONG_LEVEL, None
+    return UNKNOWN, None
+
+
+def excluded_by_hint(submission: Submission, answer: str) -> bool:
+    try:
+        value, known = int(answer), int(submission.answer)
+    except ValueError:
+        return False
+    if submission.hint == "too high":
+        return value >= known
+    if submission.hint == "too low":
+        return value <= known
+    return False
+
+
+class SubmissionLedger:
+    def __init__(self, path: str | None = None):
+        self.path = path or cache_dir("submissions.json")
+        self.wait_until = 0.0
+        self.submissions: dict[str, list[Submission]] = {}
+        self.load()
+
+    def key(self, day: int, level: int) -> str:
+        return f"day{day}-level{level}"
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.wait_until = data.get("wait_until", 0.0)
+        self.submissions = {
+            key: [Submission(**entry) for entry in entries]
+            for key, entries in data.get("submissions", {}).items()
+        }
+
+    def save(self):
+        makedirs(dirname(self.path) or ".", exist_ok=True)
+        data = {
+            "wait_until": self.wait_until,
+            "submissions": {
+                key: [asdict(entry) for entry in entries]
+                for key, entries in self.submissions.items()
+            },
+        }
+        with open(f"{self.path}.tmp", "w") as f:
+            json.dump(data, f, indent=2)
+        replace(f"{self.path}.tmp", self.path)
+
+    def history(self, day: int, level: int) -> list[Submission]:
+        return self.submissions.get(self.key(day, level), [])
+
+    def lookup(self, day: int, level: int, answer: str) -> Submission | None:
+        history = self.history(day, level)
+        for submission in history:
+            if submission.accepted:
+                return submission
+        for submission in history:
+            if submission.outcome == INCORRECT and (
+                submission.answer == answer or excluded_by_hint(submission, answer)
+            ):
+                return submission
+        return None
+
+    def record(self, submission: Submission):
+        if submission.outcome in (CORRECT, INCORRECT):
+            self.submissions.setdefault(
+                self.key(submission.day, submission.level), []
+            ).append(submission)
+        if submission.wait:
+            self.wait_until = max(
+                self.wait_until, submission.submitted_at + submission.wait
+            )
+        self.save()
+
+
+class QueuedSubmitter:
+    def __init__(
+        self,
+        client: AdventClient | None = None,
+        ledger: SubmissionLedger | None = None,
+        max_attempts: int = 3,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.client = client or AdventClient()
+        self.ledger = ledger or SubmissionLedger()
+        self.max_attempts = max_attempts
+        self.sleep = sleep
+        self.clock = clock
+        self.pending: deque[tuple[int, int, str]] = deque()
+
+    def enqueue(self, day: int, level: int, answer: str):
+        self.pending.append((day, level, str(answer)))
+
+    def wait_for_slot(self):
+        delay = self.ledger.wait_until - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+
+    def post(self, day: int, level: int, answer: str) -> Submission:
+        self.wait_for_slot()
+        submitted_at = self.clock()
+        message = self.client.submit_response(day=day, level=level, answer=answer)
+        outcome, hint = parse_outcome(message)
+        submission = Submission(
+            day,
+            level,
+            answer,
+            outcome,
+            message,
+            hint,
+            parse_wait(message),
+            submitted_at,
+        )
+        self.ledger.record(submission)
+        return submission
+
+    def process(self, day: int, level: int, answer: str) -> Submission:
+        known = self.ledger.lookup(day, level, answer)
+        if known:
+            return Submission(**{**asdict(known), "from_ledger": True})
+
+        for _ in range(self.max_attempts):
+            submission = self.post(day, level, answer)
+            if submission.outcome != TOO_SOON:
+                break
+        return submission
+
+    def drain(self) -> list[Submission]:
+        results = []
+        while self.pending:
+            results.append(self.process(*self.pending.popleft()))
+        return results
+
+    def submit(self, day: int, level: int, answer: str) -> Submission:
+        self.enqueue(day, level, answer)
+        return self.drain()[-1]
@@ -0,0 +1,115 @@
+from os import listdir, utime
+from os.path import basename, getsize
+
+from .cache import AnswerCache, ParsedInputCache, solver_sources
+from .runner import input_path, load_solver
+
+
+def read_test_input(day: int) -> str:
+    with open(input_path(day, "test.txt"), "r") as f:
+        return f.read()
+
+
+def test_parse_hits_cache(tmp_path):
+    cache = ParsedInputCache(str(tmp_path))
+    solver = load_solver(6)
+    text = read_test_input(6)
+
+    parsed = cache.parse(solver, text)
+    assert cache.get(cache.key(solver, text)) == parsed
+    assert cache.parse(solver, text) == parsed
+    assert len(listdir(tmp_path)) == 1
+
+
+def test_key_depends_on_input_and_parser(tmp_path):
+    cache = ParsedInputCache(str(tmp_path))
+    text = read_test_input(1)
+
+    key = cache.key(load_solver(1), text)
+    assert key != cache.key(load_solver(1), text + "R1\n")
+    assert key != cache.key(load_solver(5), text)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ParsedInputCache(str(tmp_path))
+    solver = load_solver(1)
+
+    cache.parse(solver, "R1")
+    first = cache.path(cache.key(solver, "R1"))
+    utime(first, (0, 0))
+    cache.max_bytes = getsize(first)
+
+    cache.parse(solver, "R2")
+    assert listdir(tmp_path) == [f"{cache.key(solver, 'R2')}.pickle"]
+
+
+def test_answers_are_reused(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    solver = load_solver(3)
+    input_file = input_path(3, "test.txt")
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        return solver.solve(input_file, first_part=True)
+
+    assert cache.solve(solver, input_file, 1, compute) == "357"
+    assert cache.solve(solver, input_file, 1, compute) == "357"
+    assert len(calls) == 1
+
+
+def test_answer_key_depends_on_day_part_and_input(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    key = cache.key(load_solver(1), input_path(1, "test.txt"), 1)
+    assert key != cache.key(load_solver(1), input_path(1, "test.txt"), 2)
+    assert key != cache.key(load_solver(1), input_path(1, "data.txt"), 1)
+    assert key != cache.key(load_solver(2), input_path(1, "test.txt"), 1)
+
+
+def test_sources_cover_shared_modules():
+    names = [basename(path) for path in solver_sources(load_solver(4))]
+
+    assert {"grid.py", "parsing.py", "solver.py", "memory.py"} <= set(names)
+    assert names.count("solver.py") == 2
+    assert not any(name.startswith("test_") or name == "conftest.py" for name in names)
+
+
+def test_caches_follow_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADVENT_CACHE_DIR", str(tmp_path))
+    assert AnswerCache().directory == str(tmp_path / "answers")
+    assert ParsedInputCache().directory == str(tmp_path / "parsed")
+
+
+def put_repeatedly(directory: str) -> None:
+    parsed, answers = ParsedInputCache(directory), AnswerCache(directory)
+    for _ in range(50):
+        parsed.put("shared", list(range(1000)))
+        answers.put("shared", "42")
+
+
+def test_concurrent_puts_on_one_key(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(put_repeatedly, [str(tmp_path)] * 4))
+
+    assert ParsedInputCache(str(tmp_path)).get("shared") == list(range(1000))
+    assert AnswerCache(str(tmp_path)).get("shared") == "42"
+    assert sorted(listdir(tmp_path)) == ["shared.json", "shared.pickle"]
+
+
+def test_failed_writes_are_ignored(tmp_path, caplog):
+    blocked = tmp_path / "file"
+    blocked.write_text("")
+
+    ParsedInputCache(str(blocked / "parsed")).put("key", [1])
+    AnswerCache(str(blocked / "answers")).put("key", "1")
+
+    assert "Could not write cache entry" in caplog.text
+
+
+def test_day_tests_share_the_answer_store(request):
+    from .conftest import DAY_TESTS
+
+    assert DAY_TESTS.match("advent.day4.test_solver")
+    assert not DAY_TESTS.match(request.module.__name__)
@@ -0,0 +1,41 @@
+import pytest
+
+from advent.day1 import solver as day1
+
+from .crosscheck import cross_check, day_engines, ddmin, find_difference
+from .generators import GENERATORS, generate
+
+
+class SkipsLongRotations(day1.Solver):
+    def count_zero_stops(self, rotations):
+        return super().count_zero_stops(
+            rotation for rotation in rotations if abs(rotation) < 900
+        )
+
+
+def cross_check_text(text: str) -> tuple[str, str] | None:
+    return find_difference(day1.Solver(), SkipsLongRotations(), text, 1)
+
+
+def test_ddmin():
+    items = [str(i) for i in range(20)]
+    assert ddmin(items, lambda items: "7" in items and "13" in items) == ["7", "13"]
+
+
+def test_reports_minimized_mismatch(monkeypatch):
+    monkeypatch.setitem(day1.ENGINES, "buggy", SkipsLongRotations)
+    mismatch = cross_check(1, "buggy", trials=5)
+    assert mismatch is not None and mismatch.part == 1
+    assert mismatch.expected != mismatch.actual
+
+    lines = mismatch.text.splitlines()
+    assert len(lines) < len(generate(1, 0.02, mismatch.seed).splitlines())
+    for i in range(len(lines)):
+        reduced = "\n".join(lines[:i] + lines[i + 1 :]) + "\n"
+        assert cross_check_text(reduced) is None
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_engines_match_reference(day):
+    for engine in day_engines(day):
+        assert cross_check(day, engine, trials=5) is None
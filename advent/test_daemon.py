@@ -0,0 +1,47 @@
+from threading import Thread
+
+import pytest
+
+from .daemon import main, send, serve, solve
+from .runner import input_path
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / "daemon.sock")
+    server = serve(path, days=[1, 3])
+    thread = Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def test_solve(daemon):
+    result = solve(3, 1, input_path(3, "test.txt"), use_cache=False, path=daemon)
+    assert (result.answer, result.error) == ("357", None)
+    assert result.parse_time > 0
+
+
+def test_reports_errors(daemon):
+    result = solve(1, 2, input_path(1, "missing.txt"), path=daemon)
+    assert "FileNotFoundError" in result.error
+    assert send({"command": "unknown"}, daemon) == {"error": "Unknown command: unknown"}
+
+
+def test_refuses_second_daemon(daemon):
+    with pytest.raises(RuntimeError):
+        serve(daemon, days=[1])
+
+
+def test_serves_on_relative_socket(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server = serve("rel.sock", days=[1])
+    thread = Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    try:
+        assert main(["--socket", "rel.sock", "solve", "1", "1", "test.txt"]) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert (tmp_path / "rel.sock").exists()
@@ -0,0 +1,25 @@
+from .generators import GENERATORS, generate
+from .runner import load_solver
+
+
+def test_generated_inputs_parse():
+    for day in GENERATORS:
+        text = generate(day, scale=0.05, seed=1)
+        assert text == generate(day, scale=0.05, seed=1)
+        load_solver(day).parse_input(text)
+
+
+def test_scale_and_seed():
+    small = generate(1, scale=1, seed=1).splitlines()
+    large = generate(1, scale=10, seed=1).splitlines()
+    assert len(large) == 10 * len(small)
+    assert generate(1, seed=1) != generate(1, seed=2)
+
+
+def test_day9_polygon_is_rectilinear():
+    points = [
+        tuple(map(int, line.split(",")))
+        for line in generate(9, scale=0.5, seed=3).splitlines()
+    ]
+    for a, b in zip(points, points[1:] + points[:1]):
+        assert (a[0] == b[0]) != (a[1] == b[1])
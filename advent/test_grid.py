@@ -0,0 +1,37 @@
+import numpy as np
+
+from .grid import NEIGHBOURS_4, Grid, neighbour_counts, shift
+
+
+def test_parse():
+    grid = Grid.parse(b"ab\r\ncd\r\n")
+    assert grid.cells.dtype == np.uint8
+    assert (grid.height, grid.width) == (2, 2)
+    assert str(grid) == "ab\ncd"
+    assert grid.find("c") == (1, 0)
+    assert grid.find("x") is None
+
+
+def test_parse_pads_ragged_lines():
+    grid = Grid.parse("abc\nd\n")
+    assert str(grid) == "abc\nd  "
+
+
+def test_shift():
+    array = np.arange(9).reshape(3, 3)
+    assert shift(array, 0, 1).tolist() == [[1, 2, 0], [4, 5, 0], [7, 8, 0]]
+    assert shift(array, -1, 0, fill=-1).tolist() == [
+        [-1, -1, -1],
+        [0, 1, 2],
+        [3, 4, 5],
+    ]
+
+
+def test_neighbour_counts():
+    mask = Grid.parse("@@.\n.@.\n...").mask("@")
+    assert neighbour_counts(mask).tolist() == [[2, 2, 2], [3, 2, 2], [1, 1, 1]]
+    assert neighbour_counts(mask, NEIGHBOURS_4).tolist() == [
+        [1, 2, 1],
+        [2, 1, 1],
+        [0, 1, 0],
+    ]
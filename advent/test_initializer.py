@@ -0,0 +1,88 @@
+import pytest
+
+from .conftest import StubReply, StubRequest
+from .initializer import AdventClient, AdventInitializer
+from .session import CachingSession, HttpCache
+
+PART_ONE = '<article class="day-desc"><h2>Part 1</h2></article>'
+PART_TWO = '<article class="day-desc"><h2>Part 2</h2></article>'
+
+
+class TaskPage:
+    def __init__(self):
+        self.version = 1
+
+    def __call__(self, request: StubRequest) -> StubReply:
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return StubReply(304)
+        body = PART_ONE if self.version == 1 else PART_ONE + PART_TWO
+        return StubReply(200, f"<main>{body}</main>", {"ETag": etag})
+
+
+@pytest.fixture
+def task_pages(stub_server):
+    pages = {day: TaskPage() for day in (1, 2)}
+    for day, page in pages.items():
+        stub_server.route("GET", f"/day/{day}", page)
+        stub_server.route(
+            "GET", f"/day/{day}/input", lambda _, day=day: StubReply(200, f"{day}\n")
+        )
+    return pages
+
+
+@pytest.fixture
+def initializer(stub_server, task_pages, tmp_path):
+    template = tmp_path / "template"
+    template.mkdir()
+    (template / "solver.py").write_text("template\n")
+    (template / "test.txt").write_text("")
+
+    session = CachingSession(cache=HttpCache(str(tmp_path / "http")), backoff=0)
+    client = AdventClient(base_url=stub_server.url, session=session)
+    initializer = AdventInitializer(client, root=str(tmp_path), workers=2)
+    initializer.current_day = lambda: 2
+    return initializer
+
+
+def test_initializes_missing_days(initializer, tmp_path):
+    reports = initializer.initialize_all_days()
+
+    assert [report.day for report in reports] == [1, 2]
+    assert reports[0].actions == [
+        "copied solver.py",
+        "copied test.txt",
+        "downloaded data.txt",
+        "updated task.html",
+    ]
+    assert (tmp_path / "day2" / "data.txt").read_text() == "2\n"
+    assert (tmp_path / "day1" / "task.html").read_text() == "<h2>Part 1</h2>"
+
+
+def test_only_fetches_outdated_artifacts(
+    initializer, stub_server, task_pages, tmp_path
+):
+    initializer.initialize_all_days()
+    (tmp_path / "day1" / "solver.py").write_text("solution\n")
+    task_pages[2].version = 2
+    stub_server.requests.clear()
+
+    first, second = initializer.initialize_all_days()
+
+    assert first.actions == [] and str(first).endswith("up to date")
+    assert second.actions == ["updated task.html"]
+    assert "Part 2" in (tmp_path / "day2" / "task.html").read_text()
+    assert (tmp_path / "day1" / "solver.py").read_text() == "solution\n"
+    assert sorted(request.path for request in stub_server.requests) == [
+        "/day/1",
+        "/day/2",
+    ]
+
+
+def test_reports_errors_per_day(initializer, stub_server):
+    del stub_server.routes[("GET", "/day/2/input")]
+
+    first, second = initializer.initialize_all_days()
+
+    assert first.error is None
+    assert second.error and "404" in second.error
@@ -0,0 +1,51 @@
+import pytest
+
+from .generators import write_input
+from .memory import MIB, InputSize, input_size, measure_memory
+from .runner import RunOptions, discover_days, load_solver, run_parts
+
+BUDGET_SIZE = InputSize(bytes=MIB, lines=1000)
+
+
+def test_input_size(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("a\nbc\nd")
+    assert input_size(str(path)) == InputSize(bytes=6, lines=3)
+
+
+def test_measure_memory():
+    with measure_memory() as usage:
+        data = bytearray(4 * MIB)
+    del data
+    assert usage.traced_peak >= 4 * MIB
+
+
+@pytest.mark.parametrize("day", discover_days())
+def test_solvers_stay_within_memory_budget(day):
+    if load_solver(day).memory_budget(BUDGET_SIZE) is None:
+        pytest.skip(f"day{day} declares no memory budget")
+
+    options = RunOptions(
+        filename=write_input(day, scale=0.25), use_cache=False, measure_memory=True
+    )
+    result = run_parts(day, [1, 2], options)[0]
+    assert result.error is None
+    assert result.memory_peak is not None and result.memory_budget is not None
+    assert not result.over_budget
+
+
+def test_measures_memory_with_warm_caches():
+    options = RunOptions(filename="test.txt", measure_memory=True)
+    run_parts(4, [1, 2], RunOptions(filename="test.txt"))
+
+    result = run_parts(4, [1, 2], options)[0]
+    assert not result.cached
+    assert result.memory_peak is not None and result.memory_budget is not None
+    assert result.parse_time > 0
+
+
+def test_memory_and_profile_are_exclusive():
+    from .main import parse_args
+
+    with pytest.raises(SystemExit):
+        parse_args(["--profile", "--memory"])
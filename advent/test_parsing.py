@@ -0,0 +1,38 @@
+import pytest
+
+from .parsing import directed_ints, extract_ints, int_ranges, int_tuples
+
+
+def test_extract_ints():
+    assert extract_ints("12, 345\nx7 -8").tolist() == [12, 345, 7, 8]
+    assert extract_ints("12, 345\nx7 -8", signed=True).tolist() == [12, 345, 7, -8]
+    assert extract_ints("").tolist() == []
+
+
+def test_extract_signed_ints_splits_adjacent_values():
+    assert extract_ints("1-2 3--4 - 5 x-", signed=True).tolist() == [1, -2, 3, -4, 5]
+
+
+def test_extract_ints_rejects_overflow():
+    with pytest.raises(ValueError):
+        extract_ints("9" * 20)
+
+
+def test_directed_ints():
+    assert directed_ints(b"R12\r\nL5\nR0\n").tolist() == [12, -5, 0]
+    with pytest.raises(ValueError):
+        directed_ints("R1\n2\n")
+
+
+def test_int_ranges():
+    assert int_ranges("11-22,95-115\n").tolist() == [[11, 22], [95, 115]]
+
+
+def test_int_tuples():
+    assert int_tuples("162,817,812\n57,618,57\n", 3).tolist() == [
+        [162, 817, 812],
+        [57, 618, 57],
+    ]
+    assert int_tuples("-5,2,3\n1,-2,-30\n", 3).tolist() == [[-5, 2, 3], [1, -2, -30]]
+    with pytest.raises(ValueError):
+        int_tuples("1,2\n3\n", 2)
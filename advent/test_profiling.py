@@ -0,0 +1,44 @@
+from os.path import exists
+
+from .cli import run
+from .day11.solver import Solver as Day11Solver
+from .profiling import Profiler
+from .runner import RunOptions, input_path, load_solver, run_part, solve_file
+
+
+def test_solve_file_writes_profiles(tmp_path):
+    profiler = Profiler(str(tmp_path), "day1_part1", top=5)
+    answer = solve_file(load_solver(1), input_path(1, "test.txt"), True, profiler)
+
+    assert answer == "3"
+    assert list(profiler.phases) == ["read", "parse", "solve"]
+    for phase in profiler.phases.values():
+        assert phase.stats_file and exists(phase.stats_file)
+        assert phase.peak_memory is not None
+    assert "parse_input" in profiler.report()
+
+
+def test_disabled_profiler_only_times():
+    profiler = Profiler()
+    solve_file(load_solver(1), input_path(1, "test.txt"), False, profiler)
+
+    assert not profiler.enabled
+    assert all(phase.stats_file is None for phase in profiler.phases.values())
+
+
+def test_profiled_runs_bypass_the_parse_cache(tmp_path):
+    options = RunOptions(filename="test.txt", profile_dir=str(tmp_path), top=50)
+    for _ in range(2):
+        result = run_part(11, 1, options)
+        assert result.answer == "5"
+        assert "parse_input" in result.profile
+        assert "_pickle" not in result.profile
+
+
+def test_profiled_cli_runs_bypass_the_parse_cache(tmp_path, capsys):
+    solver_file = input_path(11, "solver.py")
+    argv = ["test.txt", "1", "--profile", str(tmp_path), "--top", "50"]
+    for _ in range(2):
+        run(Day11Solver(), solver_file, argv)
+        output = capsys.readouterr().out
+        assert "parse_input" in output and "_pickle" not in output
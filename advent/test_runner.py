@@ -0,0 +1,59 @@
+from .cli import run
+from .day6.solver import Solver as Day6Solver
+from .runner import (
+    RunOptions,
+    discover_days,
+    input_path,
+    format_table,
+    run_all,
+    run_part,
+    run_parts,
+)
+
+
+def test_discover_days():
+    days = discover_days()
+    assert days[:3] == [1, 2, 3]
+    assert days == sorted(days)
+
+
+def test_run_part():
+    result = run_part(1, 1, RunOptions(filename="test.txt"))
+    assert result.error is None
+    assert result.answer == "3"
+
+
+def test_run_part_reports_errors():
+    result = run_part(1, 1, RunOptions(filename="missing.txt"))
+    assert result.error is not None
+    assert "ERROR" in format_table([result])
+
+
+def test_run_all():
+    results = run_all([1, 3], [1, 2], RunOptions(filename="test.txt"), workers=2)
+    assert [(r.day, r.part, r.answer) for r in results] == [
+        (1, 1, "3"),
+        (1, 2, "6"),
+        (3, 1, "357"),
+        (3, 2, "3121910778619"),
+    ]
+
+
+def test_run_all_streaming():
+    options = RunOptions(filename="test.txt", use_cache=False, stream=True)
+    streamed, regular = run_all([5, 6], [1], options, workers=1)
+    assert (streamed.answer, streamed.parse_time) == ("3", 0.0)
+    assert regular.answer == "4277556" and regular.parse_time > 0
+
+
+def test_cli_streaming_falls_back_like_the_runner(capsys):
+    run(Day6Solver(), input_path(6, "solver.py"), ["test.txt", "1", "--stream"])
+    assert capsys.readouterr().out == "Solution: 4277556\n"
+
+
+def test_run_parts_shares_one_parse():
+    options = RunOptions(filename="test.txt", use_cache=False)
+    first, second = run_parts(7, [1, 2], options)
+    assert (first.answer, second.answer) == ("21", "40")
+    assert first.parse_time > 0 and not first.shared
+    assert second.shared and second.total_time == 0
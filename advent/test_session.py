@@ -0,0 +1,68 @@
+import pytest
+
+from .conftest import StubReply, StubRequest
+from .initializer import AdventClient
+from .session import CachingSession, HttpCache
+
+TASK_PAGE = '<main><article class="day-desc"><h2>Day 1</h2></article></main>'
+
+
+def task_page(request: StubRequest) -> StubReply:
+    if request.headers.get("If-None-Match") == '"v1"':
+        return StubReply(304)
+    return StubReply(200, TASK_PAGE, {"ETag": '"v1"'})
+
+
+def task_input(request: StubRequest) -> StubReply:
+    return StubReply(200, "R1\n", {"Last-Modified": "Mon, 01 Dec 2025 05:00:00 GMT"})
+
+
+def answer(request: StubRequest) -> StubReply:
+    return StubReply(200, "<article><p>That's the right answer!</p></article>")
+
+
+@pytest.fixture
+def client(stub_server, tmp_path):
+    stub_server.route("GET", "/day/1", task_page)
+    stub_server.route("GET", "/day/1/input", task_input)
+    stub_server.route("POST", "/day/1/answer", answer)
+    session = CachingSession(
+        headers={"Cookie": "session=test"}, cache=HttpCache(str(tmp_path)), backoff=0
+    )
+    return AdventClient(base_url=stub_server.url, session=session)
+
+
+def test_task_page_is_revalidated(client, stub_server):
+    assert client.get_task(1) == "<h2>Day 1</h2>"
+    assert client.get_task(1) == "<h2>Day 1</h2>"
+
+    first, second = stub_server.requests
+    assert "If-None-Match" not in first.headers
+    assert second.headers["If-None-Match"] == '"v1"'
+    assert first.headers["Cookie"] == "session=test"
+    assert first.port == second.port
+
+
+def test_input_uses_last_modified(client, stub_server):
+    assert client.get_input(1) == "R1\n"
+    assert client.session.get(f"{client.base_url}/day/1/input").text == "R1\n"
+    assert "If-Modified-Since" in stub_server.requests[-1].headers
+
+
+def test_retries_transient_errors(client, stub_server):
+    stub_server.failures = 2
+    assert client.get_input(1) == "R1\n"
+    assert len(stub_server.requests) == 3
+
+
+def test_gives_up_after_retries(client, stub_server):
+    stub_server.failures = 10
+    with pytest.raises(Exception):
+        client.get_input(1)
+    assert len(stub_server.requests) == client.session.retries + 1
+
+
+def test_submit_is_not_retried(client, stub_server):
+    assert client.submit_response(1, 1, "42") == "That's the right answer!"
+    assert [request.method for request in stub_server.requests] == ["POST"]
+    assert stub_server.requests[0].form == {"level": "1", "answer": "42"}
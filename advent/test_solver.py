@@ -0,0 +1,34 @@
+import pytest
+
+from .runner import input_path, load_solver
+
+
+def test_solve_many():
+    solver = load_solver(3)
+    paths = [input_path(3, "test.txt"), input_path(3, "missing.txt")] * 2
+    results = list(solver.solve_many(paths, 1, workers=2))
+
+    assert sorted(result.answer or "" for result in results) == ["", "", "357", "357"]
+    errors = [result for result in results if result.error]
+    assert [result.path for result in errors] == [paths[1]] * 2
+    assert "FileNotFoundError" in errors[0].error
+
+
+def test_solve_many_in_process():
+    solver = load_solver(1)
+    results = list(solver.solve_many([input_path(1, "test.txt")], 2, workers=1))
+    assert [result.answer for result in results] == ["6"]
+
+
+def test_solve_both_matches_parts():
+    for day in (1, 7, 8):
+        solver = load_solver(day)
+        with open(input_path(day, "test.txt"), "r") as f:
+            data = solver.parse_input(f.read())
+        expected = (solver.solve_part1(data), solver.solve_part2(data))
+        assert solver.solve_both(data) == expected
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="reference"):
+        load_solver(1, "missing")
@@ -0,0 +1,121 @@
+import pytest
+
+from .conftest import StubReply, StubRequest
+from .initializer import AdventClient
+from .session import CachingSession, HttpCache
+from .submission import (
+    CORRECT,
+    INCORRECT,
+    QueuedSubmitter,
+    SubmissionLedger,
+    parse_outcome,
+    parse_wait,
+)
+
+RIGHT = (
+    "<article><p>That's the right answer! You are one gold star closer.</p></article>"
+)
+TOO_HIGH = (
+    "<article><p>That's not the right answer; your answer is too high. "
+    "Please wait one minute before trying again.</p></article>"
+)
+TOO_SOON = (
+    "<article><p>You gave an answer too recently; you have to wait after "
+    "submitting an answer before trying again. You have 30s left to wait.</p></article>"
+)
+
+
+class AnswerPage:
+    def __init__(self, correct: str, replies: list[str] | None = None):
+        self.correct = correct
+        self.replies = replies or []
+
+    def __call__(self, request: StubRequest) -> StubReply:
+        if self.replies:
+            return StubReply(200, self.replies.pop(0))
+        if request.form["answer"] == self.correct:
+            return StubReply(200, RIGHT)
+        return StubReply(200, TOO_HIGH)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_submitter(stub_server, tmp_path, clock):
+    def make(page: AnswerPage) -> QueuedSubmitter:
+        stub_server.route("POST", "/day/1/answer", page)
+        session = CachingSession(cache=HttpCache(str(tmp_path / "http")), backoff=0)
+        client = AdventClient(base_url=stub_server.url, session=session)
+        ledger = SubmissionLedger(str(tmp_path / "submissions.json"))
+        return QueuedSubmitter(client, ledger, sleep=clock.sleep, clock=clock)
+
+    return make
+
+
+def test_parses_outcomes_and_waits():
+    assert parse_outcome("That's the right answer!") == (CORRECT, None)
+    assert parse_outcome(TOO_HIGH) == (INCORRECT, "too high")
+    assert parse_wait(TOO_HIGH) == 60
+    assert parse_wait("please wait 5 minutes before trying again") == 300
+    assert parse_wait("You have 1m 5s left to wait") == 65
+    assert parse_wait(RIGHT) == 0
+
+
+def test_duplicates_are_answered_from_the_ledger(make_submitter, stub_server, clock):
+    submitter = make_submitter(AnswerPage("42"))
+
+    first = submitter.submit(1, 1, "100")
+    assert (first.outcome, first.hint, first.from_ledger) == (
+        INCORRECT,
+        "too high",
+        False,
+    )
+    assert submitter.submit(1, 1, "100").from_ledger
+    assert submitter.submit(1, 1, "150").from_ledger
+
+    assert submitter.submit(1, 1, "42").accepted
+    assert clock.sleeps == [60]
+    repeated = submitter.submit(1, 1, "42")
+    assert repeated.accepted and repeated.from_ledger
+    assert len(stub_server.requests) == 2
+
+
+def test_ledger_persists_between_submitters(make_submitter, stub_server, clock):
+    make_submitter(AnswerPage("42")).submit(1, 1, "42")
+
+    submitter = make_submitter(AnswerPage("42"))
+    assert submitter.submit(1, 1, "42").from_ledger
+    assert len(stub_server.requests) == 1
+
+
+def test_waits_and_retries_when_too_soon(make_submitter, stub_server, clock):
+    submitter = make_submitter(AnswerPage("42", [TOO_SOON]))
+    submitter.enqueue(1, 1, "42")
+    submitter.enqueue(1, 2, "7")
+
+    first, second = submitter.drain()
+
+    assert first.accepted
+    assert second.outcome == INCORRECT
+    assert clock.sleeps == [30]
+    assert [request.form["level"] for request in stub_server.requests] == [
+        "1",
+        "1",
+        "2",
+    ]
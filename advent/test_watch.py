@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from .runner import RunOptions
+from .watch import Watcher, format_watch
+
+
+@pytest.fixture
+def root(tmp_path):
+    for day in (1, 2):
+        folder = tmp_path / f"day{day}"
+        folder.mkdir()
+        for name in ("solver.py", "test_solver.py", "data.txt", "test.txt", "notes.md"):
+            (folder / name).write_text("")
+    return tmp_path
+
+
+def touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_detects_affected_inputs(root):
+    watcher = Watcher([1, 2], [1, 2], root=str(root))
+    assert watcher.poll() == {}
+
+    touch(root / "day1" / "test.txt")
+    (root / "day1" / "test2.txt").write_text("")
+    touch(root / "day1" / "notes.md")
+    touch(root / "day2" / "test_solver.py")
+    assert watcher.poll() == {1: ["test.txt", "test2.txt"]}
+
+    touch(root / "day2" / "solver.py")
+    assert watcher.poll() == {2: ["data.txt", "test.txt"]}
+    assert watcher.poll() == {}
+
+
+def test_reruns_with_previous_timings():
+    watcher = Watcher([3], [1, 2], RunOptions(use_cache=False))
+    watcher.load()
+
+    first = watcher.run({3: ["test.txt"]})
+    second = watcher.run({3: ["test.txt"]})
+
+    assert [watched.result.answer for watched in second] == ["357", "3121910778619"]
+    assert first[0].previous is None
+    assert second[0].previous == first[0].result.total_time
+    assert "test.txt" in format_watch(second)
@@ -0,0 +1,12 @@
+from os import getenv
+
+from advent.cache import AnswerCache
+
+
+def solve_cached(solver, input_file: str, first_part: bool) -> str:
+    def compute() -> str:
+        return solver.solve(input_file, first_part=first_part)
+
+    if getenv("ADVENT_NO_CACHE"):
+        return compute()
+    return AnswerCache().solve(solver, input_file, 1 if first_part else 2, compute)
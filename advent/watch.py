@@ -0,0 +1,183 @@
+import importlib
+import time
+import traceback
+from dataclasses import dataclass, replace
+from fnmatch import fnmatch
+from os import listdir, stat
+from os.path import dirname, join
+from typing import Callable
+
+import advent
+from advent.daemon import WarmSolvers
+from advent.runner import (
+    RunOptions,
+    RunResult,
+    format_answer,
+    format_columns,
+    format_time,
+    run_parts,
+    warm_imports,
+)
+
+INPUT_PATTERNS = ("test*.txt",)
+
+
+@dataclass
+class WatchResult:
+    day: int
+    filename: str
+    part: int
+    result: RunResult
+    previous: float | None = None
+
+
+def is_source(filename: str) -> bool:
+    return filename.endswith(".py") and not filename.startswith("test_")
+
+
+def is_input(filename: str, data_file: str) -> bool:
+    return filename == data_file or any(
+        fnmatch(filename, pattern) for pattern in INPUT_PATTERNS
+    )
+
+
+class Watcher:
+    def __init__(
+        self,
+        days: list[int],
+        parts: list[int],
+        options: RunOptions | None = None,
+        root: str = dirname(advent.__file__),
+    ):
+        self.days = days
+        self.parts = parts
+        self.options = options or RunOptions()
+        self.root = root
+        self.solvers = WarmSolvers(days)
+        self.timings: dict[tuple[int, str, int], float] = {}
+        self.snapshot = self.scan()
+
+    def load(self):
+        warm_imports()
+        for day in self.days:
+            try:
+                importlib.import_module(f"advent.day{day}.solver")
+            except Exception:
+                pass
+        self.solvers.refresh()
+
+    def scan_day(self, day: int) -> dict[str, int]:
+        folder = join(self.root, f"day{day}")
+        files: dict[str, int] = {}
+        try:
+            names = listdir(folder)
+        except FileNotFoundError:
+            return files
+        for name in names:
+            if is_source(name) or is_input(name, self.options.filename):
+                try:
+                    files[name] = stat(join(folder, name)).st_mtime_ns
+                except FileNotFoundError:
+                    pass
+        return files
+
+    def scan(self) -> dict[int, dict[str, int]]:
+        return {day: self.scan_day(day) for day in self.days}
+
+    def changed_inputs(
+        self, before: dict[int, dict[str, int]], after: dict[int, dict[str, int]]
+    ) -> dict[int, list[str]]:
+        changes: dict[int, list[str]] = {}
+        for day in self.days:
+            old, new = before.get(day, {}), after.get(day, {})
+            changed = {
+                name
+                for name in old.keys() | new.keys()
+                if old.get(name) != new.get(name)
+            }
+            inputs = sorted(
+                name for name in new if is_input(name, self.options.filename)
+            )
+            if any(is_source(name) for name in changed):
+                changes[day] = inputs
+            elif affected := sorted(changed & set(inputs)):
+                changes[day] = affected
+        return changes
+
+    def poll(self) -> dict[int, list[str]]:
+        snapshot = self.scan()
+        changes = self.changed_inputs(self.snapshot, snapshot)
+        self.snapshot = snapshot
+        return changes
+
+    def run_input(self, day: int, filename: str) -> list[WatchResult]:
+        options = replace(self.options, filename=filename)
+        watched = []
+        for result in run_parts(day, self.parts, options):
+            key = (day, filename, result.part)
+            watched.append(
+                WatchResult(day, filename, result.part, result, self.timings.get(key))
+            )
+            if not (result.shared or result.cached or result.error):
+                self.timings[key] = result.total_time
+        return watched
+
+    def run(self, changes: dict[int, list[str]]) -> list[WatchResult]:
+        results: list[WatchResult] = []
+        for day, filenames in sorted(changes.items()):
+            try:
+                self.solvers.refresh([day])
+            except Exception:
+                error = traceback.format_exc()
+                for filename in filenames:
+                    for part in self.parts:
+                        result = RunResult(
+                            day, part, "", error=error, shared=part != self.parts[0]
+                        )
+                        results.append(WatchResult(day, filename, part, result))
+                continue
+            for filename in filenames:
+                results.extend(self.run_input(day, filename))
+        return results
+
+    def watch(
+        self,
+        report: Callable[[list[WatchResult]], None],
+        interval: float = 0.1,
+        polls: int | None = None,
+    ):
+        while polls is None or polls > 0:
+            time.sleep(interval)
+            changes = self.poll()
+            if changes:
+                report(self.run(changes))
+            if polls is not None:
+                polls -= 1
+
+
+def format_previous(watched: WatchResult) -> str:
+    if watched.result.shared or watched.previous is None:
+        return "-" if watched.result.shared else ""
+    return format_time(watched.previous)
+
+
+def format_watch(results: list[WatchResult]) -> str:
+    header = ("Day", "Input", "Part", "Total ms", "Previous ms", "Answer")
+    rows = [
+        (
+            str(watched.day),
+            watched.filename,
+            str(watched.part),
+            "-" if watched.result.shared else format_time(watched.result.total_time),
+            format_previous(watched),
+            format_answer(watched.result),
+        )
+        for watched in results
+    ]
+    errors = [
+        f"\nDay {watched.day} {watched.filename} part {watched.part} failed:\n"
+        f"{watched.result.error}"
+        for watched in results
+        if watched.result.error and not watched.result.shared
+    ]
+    return "\n".join([format_columns(header, rows), *errors])